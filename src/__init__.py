@@ -1,3 +1,5 @@
 """SRT Subtitle Processor - Multi-language subtitle processing tool."""
 
-__version__ = "2.0.0"
+from .srt_processor import __version__
+
+__all__ = ["__version__"]
@@ -1 +1,3 @@
 """SRT Processor package."""
+
+__version__ = "2.0.0"
@@ -1,17 +1,38 @@
 """Command line interface for SRT processor."""
 
+import io
+import os
+import re
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import click
 except ImportError:
     click = None
 
+from .core.cache import ResultCache
 from .core.processor import SRTProcessor
 from .models.subtitle import ContentType, Language, ProcessingConfig
 
+# Fallback patterns for warning strings without structured violation records
+_CHAR_LIMIT_RE = re.compile(r"character limit \((\d+) > (\d+)(?:\s+(\w+))?\)")
+_LINE_RE = re.compile(r"Line (\d+)")
+_SPEED_RE = re.compile(r"Reading speed.*?\(([0-9.]+) > ([0-9.]+)")
+
+# Write buffer size for violation SRT output
+_VIOLATION_WRITE_BUFFER = 1 << 20
+
+# Enum lookup tables for CLI option values
+_LANGUAGES = {member.value: member for member in Language}
+_CONTENT_TYPES = {member.value: member for member in ContentType}
+
+# Per-process state of batch workers (set up by _init_batch_worker)
+_worker_state: Dict[str, Any] = {}
+
 
 def main_cli(
     input_file: Optional[Path] = None,
@@ -27,6 +48,8 @@ def main_cli(
     check_only: bool = False,
     output_violation: Optional[str] = None,
     keep_sdh: bool = False,
+    jobs: Optional[int] = None,
+    no_cache: bool = False,
 ) -> None:
     """SRT Subtitle Processor - Multi-language subtitle processing tool.
 
@@ -36,8 +59,9 @@ def main_cli(
     try:
         # Create processing configuration
         config = ProcessingConfig(
-            language=Language(language),
-            content_type=ContentType(content_type),
+            # Unknown values fall through to the enum constructor's ValueError
+            language=_LANGUAGES.get(language) or Language(language),
+            content_type=_CONTENT_TYPES.get(content_type) or ContentType(content_type),
             sdh_mode=sdh,
             force_encoding=force_encoding,
             no_speed_check=no_speed_check,
@@ -47,6 +71,10 @@ def main_cli(
             check_only=check_only,
             output_violation=output_violation,
             remove_sdh=not keep_sdh,
+            use_cache=not no_cache,
+            # Batch mode parallelizes across files; a single file being
+            # processed splits its blocks across the worker processes
+            max_workers=1 if batch or check_only else jobs,
         )
 
         processor = SRTProcessor(config)
@@ -54,9 +82,9 @@ def main_cli(
         if batch:
             # Batch processing mode
             if check_only:
-                _check_batch(batch, processor, verbose)
+                _check_batch(batch, processor, verbose, jobs)
             else:
-                _process_batch(batch, processor, verbose)
+                _process_batch(batch, processor, verbose, jobs)
         elif input_file:
             # Single file processing mode
             if check_only:
@@ -133,6 +161,19 @@ if click:
         is_flag=True,
         help="Keep SDH (audio/music markers) instead of removing them by default",
     )
+    @click.option(
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of parallel worker processes for batch mode or for the blocks "
+        "of a large file (default: CPU count)",
+    )
+    @click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Disable the on-disk cache of --check-only results",
+    )
     def main(
         input_file: Optional[Path],
         output_file: Optional[Path],
@@ -147,6 +188,8 @@ if click:
         check_only: bool,
         output_violation: Optional[str],
         keep_sdh: bool,
+        jobs: Optional[int],
+        no_cache: bool,
     ) -> None:
         """Click wrapper for main CLI function."""
         main_cli(
@@ -163,6 +206,8 @@ if click:
             check_only=check_only,
             output_violation=output_violation,
             keep_sdh=keep_sdh,
+            jobs=jobs,
+            no_cache=no_cache,
         )
 
 else:
@@ -189,7 +234,7 @@ def _check_single_file(
 
     try:
         # Check the file
-        results = processor.check_file_only(str(input_file))
+        results = _check_file_cached(processor, str(input_file))
 
         # Display results
         print(f"Language detected: {results['detected_language']}")
@@ -262,16 +307,21 @@ def _check_batch(
     batch_dir: Path,
     processor: SRTProcessor,
     verbose: bool,
+    jobs: Optional[int] = None,
 ) -> None:
     """Check all SRT files in a directory for compliance.
 
+    Files are checked in parallel worker processes; results are reported
+    in completion order.
+
     Args:
         batch_dir: Directory containing SRT files
         processor: SRT processor instance
         verbose: Enable verbose output
+        jobs: Number of worker processes (defaults to CPU count)
     """
     # Find all SRT files in directory
-    srt_files = list(batch_dir.glob("*.srt"))
+    srt_files = _find_srt_files(batch_dir)
 
     if not srt_files:
         print(f"No SRT files found in {batch_dir}")
@@ -284,33 +334,41 @@ def _check_batch(
     failed_count = 0
     total_violations = 0
 
-    for srt_file in srt_files:
-        try:
-            if verbose:
-                print(f"Checking: {srt_file}")
+    with ProcessPoolExecutor(
+        max_workers=_worker_count(jobs, len(srt_files)),
+        initializer=_init_batch_worker,
+        initargs=(processor.config,),
+    ) as pool:
+        futures = {
+            pool.submit(_check_batch_file, str(srt_file)): srt_file
+            for srt_file in srt_files
+        }
+
+        for future in as_completed(futures):
+            srt_file = futures[future]
+            # Per-file output is collected and written in a single call
+            report = [f"Checking: {srt_file}"] if verbose else []
+
+            try:
+                # Collect the worker's check results
+                results = future.result()
+            except Exception as e:
+                failed_count += 1
+                _write_lines(report)
+                _report_failure(srt_file, e, verbose)
+                continue
 
-            # Check the file
-            results = processor.check_file_only(str(srt_file))
             checked_count += 1
 
             violations = len(results["warnings"])
             total_violations += violations
             compliance_rate = results.get("compliance_rate", 0)
 
-            # Generate violation output file if requested (auto-generate for batch mode)
-            if processor.config.output_violation:
-                _output_violations_to_file(
-                    results,
-                    srt_file,
-                    None,
-                    verbose,  # Auto-generate filename for batch mode
-                )
-
             if verbose:
-                print(f"  Language: {results['detected_language']}")
-                print(f"  Blocks: {results['statistics']['total_blocks']}")
-                print(f"  Violations: {violations}")
-                print(f"  Compliance: {compliance_rate:.1f}%")
+                report.append(f"  Language: {results['detected_language']}")
+                report.append(f"  Blocks: {results['statistics']['total_blocks']}")
+                report.append(f"  Violations: {violations}")
+                report.append(f"  Compliance: {compliance_rate:.1f}%")
             else:
                 if compliance_rate >= 90:
                     status = "✅"
@@ -318,17 +376,18 @@ def _check_batch(
                     status = "⚠️"
                 else:
                     status = "❌"
-                print(
+                report.append(
                     f"{status} {srt_file.name} - {compliance_rate:.1f}% ({violations} violations)"
                 )
+            _write_lines(report)
 
-        except Exception as e:
-            failed_count += 1
-            print(f"✗ {srt_file.name}: {e}", file=sys.stderr)
-            if verbose:
-                import traceback
-
-                print(traceback.format_exc(), file=sys.stderr)
+            # Generate violation output file if requested (auto-generate for batch mode)
+            if processor.config.output_violation:
+                try:
+                    _output_violations_to_file(results, srt_file, None, verbose)
+                except Exception as e:
+                    failed_count += 1
+                    _report_failure(srt_file, e, verbose)
 
     # Summary
     print("\nBatch checking complete:")
@@ -367,7 +426,9 @@ def _process_single_file(
 
     try:
         # Process the file
-        result = processor.process_file(str(input_file), str(output_file))
+        result = processor.process_file(
+            str(input_file), str(output_file), validate=verbose
+        )
 
         if verbose:
             print(
@@ -381,8 +442,8 @@ def _process_single_file(
             )
             print(f"Speed validation: {speed_check_status}")
 
-            # Perform validation and show results
-            validation_results = processor.validate_document(result)
+            # Show validation results computed during processing
+            validation_results = result.validation
             if validation_results["warnings"]:
                 print(f"Validation warnings: {len(validation_results['warnings'])}")
                 for warning in validation_results["warnings"][
@@ -409,16 +470,21 @@ def _process_batch(
     batch_dir: Path,
     processor: SRTProcessor,
     verbose: bool,
+    jobs: Optional[int] = None,
 ) -> None:
     """Process all SRT files in a directory.
 
+    Files are processed in parallel worker processes; results are reported
+    in completion order.
+
     Args:
         batch_dir: Directory containing SRT files
         processor: SRT processor instance
         verbose: Enable verbose output
+        jobs: Number of worker processes (defaults to CPU count)
     """
     # Find all SRT files in directory
-    srt_files = list(batch_dir.glob("*.srt"))
+    srt_files = _find_srt_files(batch_dir)
 
     if not srt_files:
         print(f"No SRT files found in {batch_dir}")
@@ -430,44 +496,52 @@ def _process_batch(
     processed_count = 0
     failed_count = 0
 
-    for srt_file in srt_files:
-        try:
+    with ProcessPoolExecutor(
+        max_workers=_worker_count(jobs, len(srt_files)),
+        initializer=_init_batch_worker,
+        initargs=(processor.config,),
+    ) as pool:
+        futures = {}
+        for srt_file in srt_files:
             # Generate output filename
             output_file = (
                 srt_file.parent / f"{srt_file.stem}_processed{srt_file.suffix}"
             )
+            future = pool.submit(
+                _process_batch_file, str(srt_file), str(output_file), verbose
+            )
+            futures[future] = (srt_file, output_file)
+
+        for future in as_completed(futures):
+            srt_file, output_file = futures[future]
+            # Per-file output is collected and written in a single call
+            report = [f"Processing: {srt_file}"] if verbose else []
+
+            try:
+                # Collect the worker's processing summary
+                language, total_blocks, warning_count = future.result()
+            except Exception as e:
+                failed_count += 1
+                _write_lines(report)
+                _report_failure(srt_file, e, verbose)
+                continue
 
-            if verbose:
-                print(f"Processing: {srt_file}")
-
-            # Process the file
-            result = processor.process_file(str(srt_file), str(output_file))
             processed_count += 1
 
             if verbose:
-                print(
-                    f"  Language: {result.detected_language.value if result.detected_language else 'unknown'}"
-                )
-                print(f"  Blocks: {result.total_blocks}")
+                report.append(f"  Language: {language}")
+                report.append(f"  Blocks: {total_blocks}")
 
                 # Show validation results for batch processing
-                validation_results = processor.validate_document(result)
-                if validation_results["warnings"]:
-                    print(f"  Warnings: {len(validation_results['warnings'])}")
+                if warning_count:
+                    report.append(f"  Warnings: {warning_count}")
                 else:
-                    print("  Validation: ✅ No warnings")
+                    report.append("  Validation: ✅ No warnings")
 
-                print(f"  Output: {output_file}")
+                report.append(f"  Output: {output_file}")
             else:
-                print(f"✓ {srt_file.name}")
-
-        except Exception as e:
-            failed_count += 1
-            print(f"✗ {srt_file.name}: {e}", file=sys.stderr)
-            if verbose:
-                import traceback
-
-                print(traceback.format_exc(), file=sys.stderr)
+                report.append(f"✓ {srt_file.name}")
+            _write_lines(report)
 
     # Summary
     print("\nBatch processing complete:")
@@ -476,6 +550,146 @@ def _process_batch(
     print(f"  Total: {len(srt_files)}")
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call.
+
+    Args:
+        lines: Output lines (without line terminators)
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _report_failure(srt_file: Path, error: Exception, verbose: bool) -> None:
+    """Report a failed batch file on stderr.
+
+    Args:
+        srt_file: File that failed
+        error: Exception raised while handling the file
+        verbose: Include the full traceback
+    """
+    message = f"✗ {srt_file.name}: {error}\n"
+    if verbose:
+        message += "".join(
+            traceback.format_exception(type(error), error, error.__traceback__)
+        )
+        message += "\n"
+    sys.stderr.write(message)
+
+
+def _find_srt_files(batch_dir: Path) -> List[Path]:
+    """Find all SRT files directly inside a directory.
+
+    Args:
+        batch_dir: Directory to scan
+
+    Returns:
+        Sorted list of SRT file paths
+    """
+    # scandir entries carry cached type info, avoiding a stat() per entry
+    with os.scandir(batch_dir) as entries:
+        srt_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".srt") and entry.is_file()
+        ]
+    srt_files.sort()
+    return srt_files
+
+
+def _worker_count(jobs: Optional[int], file_count: int) -> int:
+    """Determine the number of worker processes for a batch run.
+
+    Args:
+        jobs: Requested number of workers (None for CPU count)
+        file_count: Number of files in the batch
+
+    Returns:
+        Number of worker processes to start
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, file_count))
+
+
+def _check_file_cached(processor: SRTProcessor, input_path: str) -> dict:
+    """Check a file, reusing cached results for unchanged files.
+
+    Args:
+        processor: SRT processor instance
+        input_path: Input SRT file path
+
+    Returns:
+        Validation results from check_file_only
+    """
+    if not processor.config.use_cache:
+        return processor.check_file_only(input_path)
+
+    cache = ResultCache()
+    key = cache.make_key(input_path, processor.config)
+    results = cache.get(key)
+    if results is None:
+        results = processor.check_file_only(input_path)
+        cache.put(key, results)
+    return results
+
+
+def _init_batch_worker(config: ProcessingConfig) -> None:
+    """Create the shared SRT processor of a batch worker process.
+
+    Args:
+        config: Processing configuration (pickled once per worker)
+    """
+    _worker_state["processor"] = SRTProcessor(config)
+
+
+def _worker_processor() -> SRTProcessor:
+    """Get the batch worker's SRT processor.
+
+    Processing a file leaves the config untouched, so the processor (and its
+    cached language processors) carries over from file to file.
+
+    Returns:
+        SRT processor shared by all files handled in this worker
+    """
+    return _worker_state["processor"]
+
+
+def _check_batch_file(input_path: str) -> dict:
+    """Check a single file inside a batch worker process.
+
+    Args:
+        input_path: Input SRT file path
+
+    Returns:
+        Validation results from check_file_only
+    """
+    processor = _worker_processor()
+    return _check_file_cached(processor, input_path)
+
+
+def _process_batch_file(
+    input_path: str, output_path: str, validate: bool
+) -> Tuple[str, int, int]:
+    """Process a single file inside a batch worker process.
+
+    Args:
+        input_path: Input SRT file path
+        output_path: Output SRT file path
+        validate: Whether to validate the processed document
+
+    Returns:
+        Tuple of (detected language code, block count, warning count)
+    """
+    processor = _worker_processor()
+    result = processor.process_file(input_path, output_path, validate=validate)
+
+    warning_count = len(result.validation["warnings"]) if validate else 0
+
+    language = result.detected_language.value if result.detected_language else "unknown"
+    return language, result.total_blocks, warning_count
+
+
 def _output_violations_to_file(
     results: dict,
     input_file: Path,
@@ -505,12 +719,12 @@ def _output_violations_to_file(
         return
 
     try:
-        # Create violation SRT content
-        srt_content = _generate_violation_srt_content(results)
-
-        # Write to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(srt_content)
+        # Stream violation SRT lines through a 1 MiB binary write buffer
+        lines = _iter_violation_srt_lines(results)
+        raw = open(output_path, "wb", buffering=_VIOLATION_WRITE_BUFFER)
+        with io.TextIOWrapper(raw, encoding="utf-8", write_through=False) as f:
+            f.write(next(lines))
+            f.writelines("\n" + line for line in lines)
 
         if verbose:
             print(f"Violation blocks written to: {output_path}")
@@ -523,21 +737,19 @@ def _output_violations_to_file(
         raise
 
 
-def _generate_violation_srt_content(results: dict) -> str:
-    """Generate SRT content containing only violation blocks with summary.
+def _iter_violation_srt_lines(results: dict) -> Iterator[str]:
+    """Generate SRT lines containing only violation blocks with summary.
 
     Args:
         results: Validation results dictionary
 
-    Returns:
-        Complete SRT file content as string
+    Yields:
+        SRT file lines (without line terminators)
     """
-    lines = []
-
     # Add summary header as first "subtitle" block
-    lines.append("1")
-    lines.append("00:00:00,000 --> 00:00:05,000")
-    lines.append("=== VIOLATION ANALYSIS SUMMARY ===")
+    yield "1"
+    yield "00:00:00,000 --> 00:00:05,000"
+    yield "=== VIOLATION ANALYSIS SUMMARY ==="
 
     # Compliance statistics
     compliance_rate = results.get("compliance_rate", 0)
@@ -551,96 +763,133 @@ def _generate_violation_srt_content(results: dict) -> str:
         "✅" if compliance_rate >= 90 else "⚠️" if compliance_rate >= 70 else "❌"
     )
 
-    lines.append(
+    yield (
         f"{status_icon} Compliance: {compliance_rate:.1f}% ({compliant_blocks}/{total_blocks} blocks)"
     )
-    lines.append(f"⚠️ Total Violations: {total_violations}")
-    lines.append(f"📊 Character Limit: {char_violations} violations")
+    yield f"⚠️ Total Violations: {total_violations}"
+    yield f"📊 Character Limit: {char_violations} violations"
     if not results.get("no_speed_check", False):
-        lines.append(f"⏱️ Reading Speed: {speed_violations} violations")
-    lines.append("")  # Empty line between blocks
+        yield f"⏱️ Reading Speed: {speed_violations} violations"
+    yield ""  # Empty line between blocks
 
     # Add violation blocks
     violation_blocks = results.get("violation_blocks", [])
-    for i, violation_data in enumerate(violation_blocks):
+    for violation_data in violation_blocks:
         block = violation_data["block"]
         violations = violation_data["violations"]
 
         # Use original block index to preserve numbering consistency
-        lines.append(str(block.index))
+        yield str(block.index)
 
         # Time code
-        lines.append(block.time_code.to_srt_format())
-
-        # Violation information as comments
-        violation_info = []
-        import re
-
-        for violation in violations:
-            # Extract the violation details
-            if "character limit" in violation:
-                # Handle both old format "Block 5: Exceeds character limit (34 > 16)"
-                # and new format "Block 5: Line 1 exceeds character limit (34 > 16)"
-                match = re.search(
-                    r"character limit \((\d+) > (\d+)(?:\s+(\w+))?\)", violation
-                )
-                if match:
-                    actual, limit = match.groups()[:2]
-                    language = (
-                        match.groups()[2]
-                        if len(match.groups()) > 2 and match.groups()[2]
-                        else None
-                    )
-
-                    # Check if it's a line-specific violation
-                    if "Line" in violation:
-                        line_match = re.search(r"Line (\d+)", violation)
-                        if line_match:
-                            line_num = line_match.group(1)
-                            if language:
-                                violation_info.append(
-                                    f"Line {line_num} character limit ({actual} > {limit} {language})"
-                                )
-                            else:
-                                violation_info.append(
-                                    f"Line {line_num} character limit ({actual} > {limit})"
-                                )
-                        else:
-                            if language:
-                                violation_info.append(
-                                    f"Character limit ({actual} > {limit} {language})"
-                                )
-                            else:
-                                violation_info.append(
-                                    f"Character limit ({actual} > {limit})"
-                                )
-                    else:
-                        if language:
-                            violation_info.append(
-                                f"Character limit ({actual} > {limit} {language})"
-                            )
-                        else:
-                            violation_info.append(
-                                f"Character limit ({actual} > {limit})"
-                            )
-            elif "Reading speed" in violation:
-                # Extract numbers: "Block 5: Reading speed too fast (16.6 > 9.0 chars/sec)"
-                match = re.search(r"Reading speed.*?\(([0-9.]+) > ([0-9.]+)", violation)
-                if match:
-                    actual, limit = match.groups()
-                    violation_info.append(
-                        f"Reading speed ({actual} > {limit} chars/sec)"
-                    )
+        yield block.time_code.to_srt_format()
+
+        # Violation information as comments, built from structured records
+        records = violation_data.get("records")
+        if records:
+            violation_info = ", ".join(map(_format_violation_record, records))
+        elif violations:
+            # Fall back to parsing the warning strings of older result dicts
+            violation_info = ", ".join(
+                filter(None, map(_parse_violation_message, violations))
+            )
+        else:
+            violation_info = ""
 
         # Add violation comment line
         if violation_info:
-            lines.append(f"# VIOLATIONS: {', '.join(violation_info)}")
+            yield f"# VIOLATIONS: {violation_info}"
 
         # Add original subtitle lines
-        lines.extend(block.lines)
-        lines.append("")  # Empty line between blocks
+        yield from block.lines
+        yield ""  # Empty line between blocks
+
 
-    return "\n".join(lines)
+def _format_violation_record(record: dict) -> str:
+    """Format a structured violation record as a violation comment entry.
+
+    Args:
+        record: Violation record from validate_document
+
+    Returns:
+        Short violation description
+    """
+    if record["type"] == "reading_speed":
+        return f"Reading speed ({record['actual']:.1f} > {record['limit']} chars/sec)"
+
+    limit = record["limit"]
+    if record.get("language"):
+        limit = f"{limit} {record['language']}"
+
+    if record.get("line"):
+        return f"Line {record['line']} character limit ({record['actual']} > {limit})"
+    return f"Character limit ({record['actual']} > {limit})"
+
+
+def _parse_char_limit_message(violation: str) -> Optional[str]:
+    """Parse a character limit warning into a violation comment entry.
+
+    Handles both old format "Block 5: Exceeds character limit (34 > 16)"
+    and new format "Block 5: Line 1 exceeds character limit (34 > 16 zh)".
+
+    Args:
+        violation: Validation warning string
+
+    Returns:
+        Short violation description, or None if the warning does not match
+    """
+    match = _CHAR_LIMIT_RE.search(violation)
+    if not match:
+        return None
+
+    actual, limit, language = match.groups()
+    if language:
+        limit = f"{limit} {language}"
+
+    line_match = _LINE_RE.search(violation) if "Line" in violation else None
+    if line_match:
+        return f"Line {line_match.group(1)} character limit ({actual} > {limit})"
+    return f"Character limit ({actual} > {limit})"
+
+
+def _parse_speed_message(violation: str) -> Optional[str]:
+    """Parse a reading speed warning into a violation comment entry.
+
+    Args:
+        violation: Validation warning string, e.g.
+            "Block 5: Reading speed too fast (16.6 > 9.0 chars/sec)"
+
+    Returns:
+        Short violation description, or None if the warning does not match
+    """
+    match = _SPEED_RE.search(violation)
+    if not match:
+        return None
+
+    actual, limit = match.groups()
+    return f"Reading speed ({actual} > {limit} chars/sec)"
+
+
+# Substring guards checked before running the matching (regex-based) parser
+_VIOLATION_PARSERS = (
+    ("character limit", _parse_char_limit_message),
+    ("Reading speed", _parse_speed_message),
+)
+
+
+def _parse_violation_message(violation: str) -> Optional[str]:
+    """Parse a violation warning string into a violation comment entry.
+
+    Args:
+        violation: Validation warning string
+
+    Returns:
+        Short violation description, or None if the warning is not recognized
+    """
+    for needle, parser in _VIOLATION_PARSERS:
+        if needle in violation:
+            return parser(violation)
+    return None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+"""On-disk cache for subtitle validation results."""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+from .. import __version__
+from ..models.subtitle import Language, ProcessingConfig, SubtitleBlock, TimeCode
+
+# Bump when the layout of cached results changes
+CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "srt_processor"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize enum values when hashing the configuration."""
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Unsupported config value: {value!r}")
+
+
+def _block_to_data(block: SubtitleBlock) -> dict:
+    """Convert a subtitle block to plain JSON data."""
+    return {
+        "index": block.index,
+        "time_code": block.time_code.to_srt_format(),
+        "lines": block.lines,
+        "language": block.language.value if block.language else None,
+        "is_sdh": block.is_sdh,
+    }
+
+
+def _block_from_data(data: dict) -> SubtitleBlock:
+    """Rebuild a subtitle block from its plain JSON data."""
+    return SubtitleBlock(
+        index=data["index"],
+        time_code=TimeCode.from_srt_time(data["time_code"]),
+        lines=data["lines"],
+        language=Language(data["language"]) if data["language"] else None,
+        is_sdh=data["is_sdh"],
+    )
+
+
+class ResultCache:
+    """Cache of check results keyed by file path, mtime, size and config.
+
+    Entries are invalidated automatically: any change to the input file, the
+    processing configuration or the package version produces a different key.
+    Results are stored as plain JSON data; the parsed original_document is
+    not cached.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the result cache.
+
+        Args:
+            cache_dir: Optional cache directory (defaults to ~/.cache/srt_processor)
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+
+    def make_key(self, input_path: str, config: ProcessingConfig) -> Optional[str]:
+        """Build the cache key for a file and configuration.
+
+        Args:
+            input_path: Path to input SRT file
+            config: Processing configuration
+
+        Returns:
+            Hex digest key, or None if the file cannot be stat'ed
+        """
+        try:
+            stat = os.stat(input_path)
+        except OSError:
+            return None
+
+        config_json = json.dumps(asdict(config), sort_keys=True, default=_json_default)
+        config_hash = hashlib.blake2b(config_json.encode()).hexdigest()
+        raw_key = (
+            f"{CACHE_VERSION}|{__version__}|{os.path.abspath(input_path)}|"
+            f"{stat.st_mtime_ns}|{stat.st_size}|{config_hash}"
+        )
+        return hashlib.blake2b(raw_key.encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[dict]:
+        """Load cached results.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached results dictionary, or None on a miss
+        """
+        if key is None:
+            return None
+
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                results = json.load(f)
+            for violation_data in results["violation_blocks"]:
+                violation_data["block"] = _block_from_data(violation_data["block"])
+            return results
+        except Exception:
+            # Unreadable, corrupt or outdated entries are plain misses
+            return None
+
+    def put(self, key: Optional[str], results: dict) -> None:
+        """Store results in the cache (failures are ignored).
+
+        Args:
+            key: Cache key from make_key
+            results: Results dictionary to store
+        """
+        if key is None:
+            return
+
+        data = {
+            name: value
+            for name, value in results.items()
+            if name != "original_document"
+        }
+        data["violation_blocks"] = [
+            {**violation_data, "block": _block_to_data(violation_data["block"])}
+            for violation_data in results.get("violation_blocks", [])
+        ]
+
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except (OSError, TypeError, ValueError):
+            # Caching is best-effort; never fail a check because of it
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
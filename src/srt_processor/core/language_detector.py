@@ -2,27 +2,181 @@
 
 import re
 from collections import Counter
-from typing import Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ..models.subtitle import Language, SRTDocument, SubtitleBlock
 
+# Unicode ranges for different scripts
+_CHINESE_RE = re.compile(r"[\u4e00-\u9fff]")
+_KOREAN_RE = re.compile(r"[\uac00-\ud7af]")
+_HIRAGANA_RE = re.compile(r"[\u3040-\u309f]")
+_KATAKANA_RE = re.compile(r"[\u30a0-\u30ff]")
+_ASCII_RE = re.compile(r"[a-zA-Z]")
+
+# Common punctuation patterns
+_CHINESE_PUNCT_RE = re.compile(r"[。！？，：" "（）【】《》]")
+_KOREAN_PUNCT_RE = re.compile(r"[。！？，：" "（）【】《》]")
+_JAPANESE_PUNCT_RE = re.compile(r"[。！？、：" "（）【】《》〈〉]")
+
+# Punctuation counted towards Chinese/Korean and Japanese scores
+_CJK_PUNCT = frozenset("。！？，：（）【】《》")
+_JAPANESE_PUNCT = frozenset("。！？、：（）【】《》〈〉")
+
+# Character class tags used by the codepoint lookup table
+_TAG_OTHER = "."
+_TAG_CHINESE = "c"
+_TAG_KOREAN = "k"
+_TAG_HIRAGANA = "h"
+_TAG_KATAKANA = "t"
+_TAG_ASCII = "a"
+_TAG_SHARED_PUNCT = "p"  # Counted as both CJK and Japanese punctuation
+_TAG_CJK_PUNCT = "q"
+_TAG_JAPANESE_PUNCT = "j"
+
+
+def _build_tag_table() -> str:
+    """Build the lookup table mapping each BMP codepoint to its class tag.
+
+    Returns:
+        String of length 0x10000 where table[codepoint] is the class tag
+    """
+    table = [_TAG_OTHER] * 0x10000
+    for low, high, tag in (
+        (0x41, 0x5A, _TAG_ASCII),
+        (0x61, 0x7A, _TAG_ASCII),
+        (0x4E00, 0x9FFF, _TAG_CHINESE),
+        (0xAC00, 0xD7AF, _TAG_KOREAN),
+        (0x3040, 0x309F, _TAG_HIRAGANA),
+        (0x30A0, 0x30FF, _TAG_KATAKANA),
+    ):
+        table[low : high + 1] = tag * (high - low + 1)
+
+    for char in _CJK_PUNCT | _JAPANESE_PUNCT:
+        if char in _CJK_PUNCT and char in _JAPANESE_PUNCT:
+            table[ord(char)] = _TAG_SHARED_PUNCT
+        elif char in _CJK_PUNCT:
+            table[ord(char)] = _TAG_CJK_PUNCT
+        else:
+            table[ord(char)] = _TAG_JAPANESE_PUNCT
+
+    return "".join(table)
+
+
+# Usable with str.translate: codepoints above the BMP map to themselves
+_TAG_TABLE = _build_tag_table()
+
+# Scored languages, in tie-breaking order
+_CHINESE = Language.CHINESE
+_ENGLISH = Language.ENGLISH
+_KOREAN = Language.KOREAN
+_JAPANESE = Language.JAPANESE
+
+# Blocks joined per _count_characters call when counting a whole document
+_COUNT_CHUNK_BLOCKS = 1024
+
+# Keys of the _count_characters result
+_COUNT_KEYS = (
+    "chinese",
+    "korean",
+    "hiragana",
+    "katakana",
+    "ascii",
+    "chinese_punct",
+    "korean_punct",
+    "japanese_punct",
+    "total_chars",
+)
+
+# Pure-ASCII text shorter than this is English as soon as it contains a
+# letter: one letter still clears the 0.01 minimum score threshold
+_ASCII_ENGLISH_MAX_LENGTH = 1000
+
+# One bit per language for is_mixed_language_document
+_LANGUAGE_BITS = {language: 1 << bit for bit, language in enumerate(Language)}
+
+# Maximum number of distinct texts remembered by the detection cache
+_TEXT_CACHE_SIZE = 8192
+
+# Texts longer than this are counted with NumPy when it is installed
+_NUMPY_MIN_LENGTH = 4096
+
+if np is not None:
+    _TAG_CODES = np.frombuffer(_TAG_TABLE.encode("ascii"), dtype=np.uint8)
+
+
+@dataclass
+class LanguageAnalysis:
+    """Result of analyzing all blocks of a document in one pass."""
+
+    primary_language: Language
+    block_languages: List[Language]
+    mixed_language: bool
+    character_counts: Dict[str, int]
+
 
 class LanguageDetector:
     """Automatic language detection for subtitle content."""
 
     def __init__(self) -> None:
         """Initialize the language detector."""
-        # Unicode ranges for different scripts
-        self.chinese_pattern = re.compile(r"[\u4e00-\u9fff]")
-        self.korean_pattern = re.compile(r"[\uac00-\ud7af]")
-        self.hiragana_pattern = re.compile(r"[\u3040-\u309f]")
-        self.katakana_pattern = re.compile(r"[\u30a0-\u30ff]")
-        self.ascii_pattern = re.compile(r"[a-zA-Z]")
+        # Unicode ranges for different scripts (shared compiled patterns)
+        self.chinese_pattern = _CHINESE_RE
+        self.korean_pattern = _KOREAN_RE
+        self.hiragana_pattern = _HIRAGANA_RE
+        self.katakana_pattern = _KATAKANA_RE
+        self.ascii_pattern = _ASCII_RE
 
         # Common punctuation patterns
-        self.chinese_punct = re.compile(r"[。！？，：" "（）【】《》]")
-        self.korean_punct = re.compile(r"[。！？，：" "（）【】《》]")
-        self.japanese_punct = re.compile(r"[。！？、：" "（）【】《》〈〉]")
+        self.chinese_punct = _CHINESE_PUNCT_RE
+        self.korean_punct = _KOREAN_PUNCT_RE
+        self.japanese_punct = _JAPANESE_PUNCT_RE
+
+        # Block and line counts and detection results keyed by text, shared by
+        # all public methods (the cached counts must not be modified)
+        self._text_analysis = lru_cache(maxsize=_TEXT_CACHE_SIZE)(self._analyze_text)
+
+    def analyze(self, document: SRTDocument) -> LanguageAnalysis:
+        """Detect primary and per-block languages in a single pass.
+
+        Equivalent to calling detect_language, _detect_block_language for
+        every block and is_mixed_language_document, but counts each block's
+        characters only once.
+
+        Args:
+            document: SRT document to analyze
+
+        Returns:
+            Analysis with primary language, block languages and counts
+        """
+        totals = dict.fromkeys(_COUNT_KEYS, 0)
+        block_languages = []
+
+        for block in document.blocks:
+            text = block.text
+            char_counts, language = self._text_analysis(text)
+            for key, count in char_counts.items():
+                totals[key] += count
+            block_languages.append(language if text.strip() else Language.ENGLISH)
+
+        if document.blocks:
+            scores = self._calculate_language_scores(totals)
+            primary_language = max(scores.keys(), key=lambda lang: scores[lang])
+        else:
+            primary_language = Language.ENGLISH  # Default fallback
+
+        return LanguageAnalysis(
+            primary_language=primary_language,
+            block_languages=block_languages,
+            mixed_language=len(set(block_languages)) > 1,
+            character_counts=totals,
+        )
 
     def detect_language(self, document: SRTDocument) -> Language:
         """Detect the primary language of a document.
@@ -68,10 +222,21 @@ class LanguageDetector:
         if not text.strip():
             return Language.ENGLISH
 
+        return self._text_analysis(text)[1]
+
+    def _analyze_text(self, text: str) -> Tuple[Dict[str, int], Language]:
+        """Count and score text (uncached).
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Tuple of (character counts, language with the highest score)
+        """
         char_counts = self._count_characters(text)
         scores = self._calculate_language_scores(char_counts)
 
-        return max(scores.keys(), key=lambda lang: scores[lang])
+        return char_counts, max(scores.keys(), key=lambda lang: scores[lang])
 
     def detect_line_language(self, line: str) -> Language:
         """Detect language for a single line of text.
@@ -85,10 +250,37 @@ class LanguageDetector:
         if not line.strip():
             return Language.ENGLISH
 
-        char_counts = self._count_characters(line)
-        scores = self._calculate_language_scores(char_counts)
+        # Cheap script check first: ASCII text with a letter can only score
+        # as English (it has no CJK characters or punctuation at all)
+        if (
+            len(line) < _ASCII_ENGLISH_MAX_LENGTH
+            and line.isascii()
+            and _ASCII_RE.search(line)
+        ):
+            return Language.ENGLISH
+
+        # Lines are looked up repeatedly (bilingual checks, processing and
+        # validation), so they share the per-text cache with blocks
+        return self._text_analysis(line)[1]
 
-        return max(scores.keys(), key=lambda lang: scores[lang])
+    def detect_lines_batch(self, lines: List[str]) -> List[Language]:
+        """Detect languages for many lines of text at once.
+
+        Equivalent to calling detect_line_language for each line, but every
+        distinct line is resolved only once.
+
+        Args:
+            lines: Text lines to analyze
+
+        Returns:
+            Detected language for each line, in order
+        """
+        languages: Dict[str, Language] = {}
+        for line in lines:
+            if line not in languages:
+                languages[line] = self.detect_line_language(line)
+
+        return [languages[line] for line in lines]
 
     def _analyze_character_distribution(
         self, blocks: List[SubtitleBlock]
@@ -101,8 +293,16 @@ class LanguageDetector:
         Returns:
             Dictionary with character type counts
         """
-        combined_text = " ".join(block.text for block in blocks)
-        return self._count_characters(combined_text)
+        # Count a bounded chunk of blocks at a time and sum the counts, rather
+        # than joining the whole document into one string
+        totals = dict.fromkeys(_COUNT_KEYS, 0)
+        for start in range(0, len(blocks), _COUNT_CHUNK_BLOCKS):
+            chunk = blocks[start : start + _COUNT_CHUNK_BLOCKS]
+            chunk_counts = self._count_characters(" ".join([b.text for b in chunk]))
+            for key, count in chunk_counts.items():
+                totals[key] += count
+
+        return totals
 
     def _count_characters(self, text: str) -> Dict[str, int]:
         """Count different types of characters in text.
@@ -113,18 +313,48 @@ class LanguageDetector:
         Returns:
             Dictionary with character type counts
         """
+        if np is not None and len(text) > _NUMPY_MIN_LENGTH:
+            tag_counts = np.bincount(
+                _TAG_CODES[self._bmp_codes(text)], minlength=0x80
+            ).tolist()
+
+            def count_tag(tag: str) -> int:
+                return tag_counts[ord(tag)]
+
+        else:
+            # Map every codepoint to its class tag in one pass, then count tags
+            count_tag = text.translate(_TAG_TABLE).count
+
+        shared_punct = count_tag(_TAG_SHARED_PUNCT)
+        cjk_punct = shared_punct + count_tag(_TAG_CJK_PUNCT)
+
         return {
-            "chinese": len(self.chinese_pattern.findall(text)),
-            "korean": len(self.korean_pattern.findall(text)),
-            "hiragana": len(self.hiragana_pattern.findall(text)),
-            "katakana": len(self.katakana_pattern.findall(text)),
-            "ascii": len(self.ascii_pattern.findall(text)),
-            "chinese_punct": len(self.chinese_punct.findall(text)),
-            "korean_punct": len(self.korean_punct.findall(text)),
-            "japanese_punct": len(self.japanese_punct.findall(text)),
-            "total_chars": len(text.replace(" ", "")),
+            "chinese": count_tag(_TAG_CHINESE),
+            "korean": count_tag(_TAG_KOREAN),
+            "hiragana": count_tag(_TAG_HIRAGANA),
+            "katakana": count_tag(_TAG_KATAKANA),
+            "ascii": count_tag(_TAG_ASCII),
+            "chinese_punct": cjk_punct,
+            "korean_punct": cjk_punct,
+            "japanese_punct": shared_punct + count_tag(_TAG_JAPANESE_PUNCT),
+            "total_chars": len(text) - text.count(" "),
         }
 
+    @staticmethod
+    def _bmp_codes(text: str) -> "np.ndarray":
+        """Get the Basic Multilingual Plane codepoints of text as an array.
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            uint32 array of codepoints below U+10000 (no tracked class lies above)
+        """
+        codes = np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+        )
+        return codes[codes < 0x10000]
+
     def _calculate_language_scores(
         self, char_counts: Dict[str, int]
     ) -> Dict[Language, float]:
@@ -138,17 +368,10 @@ class LanguageDetector:
         """
         total_chars = max(char_counts["total_chars"], 1)  # Avoid division by zero
 
-        scores = {
-            Language.CHINESE: 0.0,
-            Language.ENGLISH: 0.0,
-            Language.KOREAN: 0.0,
-            Language.JAPANESE: 0.0,
-        }
-
         # Chinese scoring
         chinese_ratio = char_counts["chinese"] / total_chars
         chinese_punct_ratio = char_counts["chinese_punct"] / total_chars
-        scores[Language.CHINESE] = chinese_ratio * 10 + chinese_punct_ratio * 2
+        chinese_score = chinese_ratio * 10 + chinese_punct_ratio * 2
 
         # English scoring
         ascii_ratio = char_counts["ascii"] / total_chars
@@ -162,14 +385,14 @@ class LanguageDetector:
         cjk_ratio = cjk_total / total_chars
 
         if cjk_ratio < 0.1:  # Less than 10% CJK characters
-            scores[Language.ENGLISH] = ascii_ratio * 10
+            english_score = ascii_ratio * 10
         else:
-            scores[Language.ENGLISH] = ascii_ratio * 2
+            english_score = ascii_ratio * 2
 
         # Korean scoring
         korean_ratio = char_counts["korean"] / total_chars
         korean_punct_ratio = char_counts["korean_punct"] / total_chars
-        scores[Language.KOREAN] = korean_ratio * 10 + korean_punct_ratio * 2
+        korean_score = korean_ratio * 10 + korean_punct_ratio * 2
 
         # Japanese scoring
         hiragana_ratio = char_counts["hiragana"] / total_chars
@@ -179,16 +402,16 @@ class LanguageDetector:
         # Japanese often mixes hiragana, katakana, and kanji (Chinese characters)
         japanese_script_ratio = hiragana_ratio + katakana_ratio
         japanese_with_kanji_ratio = japanese_script_ratio + (chinese_ratio * 0.5)
-
-        scores[Language.JAPANESE] = (
-            japanese_with_kanji_ratio * 10 + japanese_punct_ratio * 2
-        )
+        japanese_score = japanese_with_kanji_ratio * 10 + japanese_punct_ratio * 2
 
         # Apply minimum thresholds
         min_threshold = 0.01
-        for lang in scores:
-            if scores[lang] < min_threshold:
-                scores[lang] = 0.0
+        scores = {
+            _CHINESE: chinese_score if chinese_score >= min_threshold else 0.0,
+            _ENGLISH: english_score if english_score >= min_threshold else 0.0,
+            _KOREAN: korean_score if korean_score >= min_threshold else 0.0,
+            _JAPANESE: japanese_score if japanese_score >= min_threshold else 0.0,
+        }
 
         return scores
 
@@ -201,17 +424,13 @@ class LanguageDetector:
         Returns:
             Dictionary with language analysis details
         """
-        char_counts = self._analyze_character_distribution(document.blocks)
+        analysis = self.analyze(document)
+        char_counts = analysis.character_counts
         scores = self._calculate_language_scores(char_counts)
         detected_language = max(scores.keys(), key=lambda lang: scores[lang])
 
         # Block-level analysis
-        block_languages = []
-        for block in document.blocks:
-            block_lang = self._detect_block_language(block)
-            block_languages.append(block_lang)
-
-        language_distribution = Counter(block_languages)
+        language_distribution = Counter(analysis.block_languages)
 
         return {
             "detected_language": detected_language,
@@ -221,7 +440,7 @@ class LanguageDetector:
             "language_distribution": {
                 lang.value: count for lang, count in language_distribution.items()
             },
-            "mixed_language": len(set(block_languages)) > 1,
+            "mixed_language": analysis.mixed_language,
         }
 
     def is_mixed_language_document(self, document: SRTDocument) -> bool:
@@ -236,12 +455,11 @@ class LanguageDetector:
         if len(document.blocks) < 2:
             return False
 
-        languages = set()
+        # Bitmask of languages seen so far; stop as soon as a second bit is set
+        seen = 0
         for block in document.blocks:
-            lang = self._detect_block_language(block)
-            languages.add(lang)
-
-            if len(languages) > 1:
+            seen |= _LANGUAGE_BITS[self._detect_block_language(block)]
+            if seen & (seen - 1):
                 return True
 
         return False
@@ -1,8 +1,13 @@
 """SRT file parser for reading and writing subtitle files."""
 
+import codecs
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple, Union
 
 try:
     import chardet
@@ -11,23 +16,52 @@ except ImportError:
 
 from ..models.subtitle import SRTDocument, SubtitleBlock, TimeCode
 
+# Bytes read from the start of a file for encoding detection
+_ENCODING_SAMPLE_SIZE = 32 * 1024
+
+# Buffer size used when writing SRT files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# SRT time code line: "00:01:13,933 --> 00:01:18,233"
+_TIME_RE = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})")
+
+# One well-formed subtitle block: index line, canonical time line (captured as
+# eight integer fields) and the text lines up to the next "index + time code"
+# line pair (or the end of the content). The text group is empty or starts with
+# the newline that ends the time line.
+# Anything this does not match is left to the line-based parser.
+_NEXT_BLOCK = (
+    r"[^\S\n]*\S+[^\S\n]*\n[^\S\n]*"
+    r"\d{2}:\d{2}:\d{2},\d{3}[^\S\n]*-->[^\S\n]*\d{2}:\d{2}:\d{2},\d{3}"
+)
+_BLOCK_RE = re.compile(
+    r"[^\S\n]*([0-9]+)[^\S\n]*\n"
+    r"[^\S\n]*([0-9]{2}):([0-9]{2}):([0-9]{2}),([0-9]{3}) --> "
+    r"([0-9]{2}):([0-9]{2}):([0-9]{2}),([0-9]{3})[^\S\n]*"
+    rf"((?:\n(?!{_NEXT_BLOCK})[^\n]*)*)"
+    rf"(?=\n{_NEXT_BLOCK}|\Z)"
+)
+
 
 class SRTParseError(Exception):
     """Exception raised when SRT parsing fails."""
 
     def __init__(self, message: str, line_number: Optional[int] = None) -> None:
+        self.message = message
         self.line_number = line_number
         super().__init__(f"Line {line_number}: {message}" if line_number else message)
 
+    def __reduce__(self) -> tuple:
+        """Keep the line number when the error crosses a process boundary."""
+        return self.__class__, (self.message, self.line_number)
+
 
 class SRTParser:
     """Parser for SRT subtitle files."""
 
     def __init__(self) -> None:
         """Initialize the SRT parser."""
-        self.time_pattern = re.compile(
-            r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})"
-        )
+        self.time_pattern = _TIME_RE
 
     def parse_file(self, file_path: str, encoding: Optional[str] = None) -> SRTDocument:
         """Parse an SRT file and return a SRTDocument.
@@ -46,18 +80,89 @@ class SRTParser:
         if not path.exists():
             raise SRTParseError(f"File not found: {file_path}")
 
+        # Map the file so the encoding sample and the decoded text both come
+        # straight from the page cache, without an intermediate bytes copy
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                content, encoding = self._decode_content(b"", encoding)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    content, encoding = self._decode_content(data, encoding)
+
+        blocks = self._parse_content(content)
+        return SRTDocument(blocks=blocks, source_file=str(path), encoding=encoding)
+
+    def parse_files(
+        self,
+        file_paths: Iterable[str],
+        encoding: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[SRTDocument]:
+        """Parse several SRT files in parallel worker processes.
+
+        Args:
+            file_paths: Paths to the SRT files
+            encoding: Optional encoding override for all files
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            Parsed documents, in the order of file_paths
+
+        Raises:
+            SRTParseError: If parsing any file fails
+        """
+        file_paths = list(file_paths)
+        parse = partial(self.parse_file, encoding=encoding)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        if workers <= 1:
+            return [parse(file_path) for file_path in file_paths]
+
+        # A few files per task keeps the inter-process overhead low while
+        # still spreading work evenly across the workers
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse, file_paths, chunksize=chunksize))
+
+    def _decode_content(
+        self, data: Union[bytes, mmap.mmap], encoding: Optional[str]
+    ) -> Tuple[str, str]:
+        """Decode raw file data the way reading it in text mode would.
+
+        Args:
+            data: Raw file data
+            encoding: Optional encoding override
+
+        Returns:
+            Tuple of (decoded content with normalized newlines, encoding used)
+
+        Raises:
+            SRTParseError: If the data cannot be decoded
+        """
         # Detect encoding if not provided
-        if encoding is None:
-            encoding = self._detect_encoding(path)
+        detected = encoding is None
+        if detected:
+            encoding = self._detect_encoding(data)
 
         try:
-            with open(path, "r", encoding=encoding) as f:
-                content = f.read()
+            content = str(data, encoding)
         except UnicodeDecodeError as e:
-            raise SRTParseError(f"Encoding error with {encoding}: {e}")
+            if not detected:
+                raise SRTParseError(f"Encoding error with {encoding}: {e}")
 
-        blocks = self._parse_content(content)
-        return SRTDocument(blocks=blocks, source_file=str(path), encoding=encoding)
+            # The guess from the leading sample does not hold for the rest of
+            # the file, so detect again from all of it
+            encoding = self._detect_encoding(data, full=True)
+            try:
+                content = str(data, encoding)
+            except UnicodeDecodeError as e:
+                raise SRTParseError(f"Encoding error with {encoding}: {e}")
+
+        # Universal newlines, as in text mode
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        return content, encoding
 
     def parse_content(self, content: str) -> SRTDocument:
         """Parse SRT content from a string.
@@ -71,24 +176,42 @@ class SRTParser:
         blocks = self._parse_content(content)
         return SRTDocument(blocks=blocks)
 
-    def _detect_encoding(self, file_path: Path) -> str:
-        """Detect file encoding using chardet.
+    def _detect_encoding(
+        self, data: Union[bytes, mmap.mmap], full: bool = False
+    ) -> str:
+        """Detect the encoding of raw file data using chardet.
+
+        A UTF-8 BOM, or non-ASCII text in the leading sample that decodes as
+        UTF-8, settles the encoding from the sample alone. An all-ASCII sample
+        says nothing about the rest of the file, so chardet then looks at all
+        of the data.
 
         Args:
-            file_path: Path to the file
+            data: Raw file data
+            full: Detect from all of the data instead of the leading sample
 
         Returns:
             Detected encoding name
         """
+        sample = data[:_ENCODING_SAMPLE_SIZE]
+        if sample.startswith(codecs.BOM_UTF8):
+            return "UTF-8-SIG"
+
+        if full or sample.isascii():
+            raw = data[:]
+        else:
+            try:
+                # Not final: the sample may end in the middle of a character
+                codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+                return "utf-8"
+            except UnicodeDecodeError:
+                raw = sample
+
         if chardet is None:
             # Fallback to utf-8 if chardet not available
             return "utf-8"
 
-        with open(file_path, "rb") as f:
-            raw_data = f.read()
-
-        result = chardet.detect(raw_data)
-        encoding = result.get("encoding", "utf-8")
+        encoding = chardet.detect(raw).get("encoding")
 
         # Common encoding fallbacks
         if encoding is None or encoding.lower() in ["ascii"]:
@@ -105,16 +228,63 @@ class SRTParser:
         Returns:
             List of parsed subtitle blocks
 
+        Raises:
+            SRTParseError: If parsing fails
+        """
+        content = content.strip()
+        blocks = []
+        position = 0
+
+        while position < len(content):
+            match = _BLOCK_RE.match(content, position)
+            if not match:
+                return self._parse_lines(content)
+
+            text_lines = [line.rstrip() for line in match.group(10).split("\n")[1:]]
+            while text_lines and not text_lines[-1]:
+                text_lines.pop()
+
+            if not text_lines:
+                return self._parse_lines(content)
+
+            blocks.append(
+                SubtitleBlock(
+                    index=int(match.group(1)),
+                    time_code=TimeCode.from_fields(
+                        *map(int, match.group(2, 3, 4, 5, 6, 7, 8, 9))
+                    ),
+                    lines=text_lines,
+                )
+            )
+            # Skip the newline in front of the next block's index line
+            position = match.end() + 1
+
+        return blocks
+
+    def _parse_lines(self, content: str) -> List[SubtitleBlock]:
+        """Parse SRT content line by line.
+
+        Used for content the block pattern does not cover, so malformed files
+        get the same error messages and line numbers as before.
+
+        Args:
+            content: Stripped SRT content
+
+        Returns:
+            List of parsed subtitle blocks
+
         Raises:
             SRTParseError: If parsing fails
         """
         blocks = []
-        lines = content.strip().split("\n")
+        lines = content.split("\n")
+        # Stripped once here and shared by every block (including lookaheads)
+        stripped = [line.strip() for line in lines]
         current_line = 0
 
         while current_line < len(lines):
             try:
-                block, next_line = self._parse_block(lines, current_line)
+                block, next_line = self._parse_block(lines, stripped, current_line)
                 if block:
                     blocks.append(block)
                 current_line = next_line
@@ -124,12 +294,13 @@ class SRTParser:
         return blocks
 
     def _parse_block(
-        self, lines: List[str], start_line: int
+        self, lines: List[str], stripped: List[str], start_line: int
     ) -> tuple[Optional[SubtitleBlock], int]:
         """Parse a single subtitle block.
 
         Args:
             lines: All lines from the file
+            stripped: The same lines with surrounding whitespace removed
             start_line: Line index to start parsing from
 
         Returns:
@@ -138,14 +309,14 @@ class SRTParser:
         current_line = start_line
 
         # Skip empty lines
-        while current_line < len(lines) and not lines[current_line].strip():
+        while current_line < len(lines) and not stripped[current_line]:
             current_line += 1
 
         if current_line >= len(lines):
             return None, current_line
 
         # Parse subtitle index
-        index_line = lines[current_line].strip()
+        index_line = stripped[current_line]
         if not index_line.isdigit():
             raise SRTParseError(f"Expected subtitle index, got: {index_line}")
 
@@ -156,7 +327,7 @@ class SRTParser:
             raise SRTParseError("Unexpected end of file after index")
 
         # Parse time code
-        time_line = lines[current_line].strip()
+        time_line = stripped[current_line]
         time_match = self.time_pattern.match(time_line)
         if not time_match:
             raise SRTParseError(f"Invalid time format: {time_line}")
@@ -168,18 +339,14 @@ class SRTParser:
         text_lines = []
 
         while current_line < len(lines):
-            line = lines[current_line]
-            stripped_line = line.strip()
-
             # Stop if we hit what looks like the next subtitle index (a standalone digit)
-            if stripped_line.isdigit() and (current_line + 1 < len(lines)):
+            if stripped[current_line].isdigit() and (current_line + 1 < len(lines)):
                 # Check if the next line looks like a timestamp to confirm this is a subtitle index
-                next_line = lines[current_line + 1].strip()
-                if self.time_pattern.match(next_line):
+                if self.time_pattern.match(stripped[current_line + 1]):
                     break
 
             # Add the line to subtitle text
-            text_lines.append(line.rstrip())
+            text_lines.append(lines[current_line].rstrip())
             current_line += 1
 
         # Remove trailing empty lines
@@ -206,10 +373,15 @@ class SRTParser:
         if encoding is None:
             encoding = document.encoding
 
-        content = document.to_srt_format()
-
-        with open(output_path, "w", encoding=encoding) as f:
-            f.write(content)
+        # Stream the lines through a large write buffer instead of building
+        # the whole serialized document as one string first
+        lines = document.iter_srt_lines()
+        with open(
+            output_path, "w", encoding=encoding, buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            # Always write once, so encodings with a BOM emit it for empty output
+            f.write(next(lines, ""))
+            f.writelines("\n" + line for line in lines)
 
     def validate_srt_format(self, content: str) -> List[str]:
         """Validate SRT format and return list of issues.
@@ -221,20 +393,21 @@ class SRTParser:
             List of validation errors (empty if valid)
         """
         issues = []
-        lines = content.strip().split("\n")
+        # Every check below looks at stripped lines; strip each one only once
+        lines = [line.strip() for line in content.strip().split("\n")]
         current_line = 0
         expected_index = 1
 
         while current_line < len(lines):
             # Skip empty lines
-            while current_line < len(lines) and not lines[current_line].strip():
+            while current_line < len(lines) and not lines[current_line]:
                 current_line += 1
 
             if current_line >= len(lines):
                 break
 
             # Check index
-            index_line = lines[current_line].strip()
+            index_line = lines[current_line]
             if not index_line.isdigit():
                 issues.append(
                     f"Line {current_line + 1}: Expected index, got '{index_line}'"
@@ -256,7 +429,7 @@ class SRTParser:
                 break
 
             # Check time code
-            time_line = lines[current_line].strip()
+            time_line = lines[current_line]
             if not self.time_pattern.match(time_line):
                 issues.append(
                     f"Line {current_line + 1}: Invalid time format '{time_line}'"
@@ -268,8 +441,8 @@ class SRTParser:
             text_line_count = 0
             while (
                 current_line < len(lines)
-                and lines[current_line].strip()
-                and not lines[current_line].strip().isdigit()
+                and lines[current_line]
+                and not lines[current_line].isdigit()
             ):
                 text_line_count += 1
                 current_line += 1
@@ -1,6 +1,12 @@
 """Main SRT processing engine that coordinates all components."""
 
-from typing import Dict, Type
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from ..models.subtitle import Language, ProcessingConfig, SRTDocument, SubtitleBlock
 from ..processors.chinese import ChineseProcessor
@@ -9,6 +15,16 @@ from ..processors.korean import KoreanProcessor
 from .language_detector import LanguageDetector
 from .parser import SRTParser
 
+# Block index prefix of validation warnings: "Block 10: ..."
+_WARNING_BLOCK_RE = re.compile(r"Block (\d+):")
+
+# Documents with fewer blocks are processed serially: below this, starting
+# worker processes costs more than processing the blocks
+_PARALLEL_MIN_BLOCKS = 5000
+
+# Per-process state of block workers (set up by _init_block_worker)
+_block_worker: Dict[str, "SRTProcessor"] = {}
+
 
 class SRTProcessor:
     """Main SRT processing engine."""
@@ -31,12 +47,21 @@ class SRTProcessor:
             # Japanese processor would go here
         }
 
-    def process_file(self, input_path: str, output_path: str) -> SRTDocument:
+        # Processor instances reused across blocks, keyed by processor class
+        # and config language override (see _get_processor)
+        self._processor_cache: Dict[Tuple[Type, Optional[Language]], Any] = {}
+        self._processor_cache_config: Optional[ProcessingConfig] = None
+
+    def process_file(
+        self, input_path: str, output_path: str, validate: bool = False
+    ) -> SRTDocument:
         """Process an SRT file from input to output.
 
         Args:
             input_path: Path to input SRT file
             output_path: Path to output SRT file
+            validate: Also validate the result and store it on the
+                returned document's ``validation`` attribute
 
         Returns:
             Processed SRT document
@@ -46,31 +71,104 @@ class SRTProcessor:
             input_path, encoding=self.config.force_encoding
         )
 
-        # Detect language if auto mode
+        processed_document = self._process_parsed_document(document)
+
+        # Write output file
+        self.parser.write_file(
+            processed_document, output_path, encoding=self.config.force_encoding
+        )
+
+        if validate:
+            processed_document.validation = self.validate_document(processed_document)
+
+        return processed_document
+
+    def process_files(
+        self, file_pairs: Iterable[Tuple[str, str]], validate: bool = False
+    ) -> List[SRTDocument]:
+        """Process several SRT files, overlapping file I/O with processing.
+
+        While a document is processed, the next input file is parsed on a
+        reader thread and the previous output is written on a writer thread.
+        Files are independent: a language detected in auto mode only applies
+        to its own file.
+
+        Args:
+            file_pairs: (input path, output path) of each file
+            validate: Also validate each result and store it on the
+                returned document's ``validation`` attribute
+
+        Returns:
+            Processed SRT documents, in the order of file_pairs
+        """
+        file_pairs = list(file_pairs)
+        config = self.config
+        parse = partial(self.parser.parse_file, encoding=config.force_encoding)
+        processed_documents = []
+
+        with ThreadPoolExecutor(max_workers=1) as reader, ThreadPoolExecutor(
+            max_workers=1
+        ) as writer:
+            if file_pairs:
+                next_document = reader.submit(parse, file_pairs[0][0])
+            pending_write = None
+
+            for position, (_, output_path) in enumerate(file_pairs):
+                document = next_document.result()
+                if position + 1 < len(file_pairs):
+                    next_document = reader.submit(parse, file_pairs[position + 1][0])
+
+                processed_document = self._process_parsed_document(document)
+
+                # Keep at most one write in flight so finished documents do
+                # not pile up behind a slow disk
+                if pending_write is not None:
+                    pending_write.result()
+                pending_write = writer.submit(
+                    self.parser.write_file,
+                    processed_document,
+                    output_path,
+                    encoding=config.force_encoding,
+                )
+
+                if validate:
+                    processed_document.validation = self.validate_document(
+                        processed_document
+                    )
+                processed_documents.append(processed_document)
+
+            if pending_write is not None:
+                pending_write.result()
+
+        return processed_documents
+
+    def _process_parsed_document(self, document: SRTDocument) -> SRTDocument:
+        """Detect the languages of a parsed document and process it.
+
+        Args:
+            document: Parsed input document
+
+        Returns:
+            Processed SRT document
+        """
+        # Detect document and individual block languages in one pass
+        analysis = self.language_detector.analyze(document)
+        for block, block_language in zip(document.blocks, analysis.block_languages):
+            block.language = block_language
+
+        # Use the detected language if auto mode (the config is left as is;
+        # processors get the document language through _get_processor)
         if self.config.language == Language.AUTO:
-            detected_language = self.language_detector.detect_language(document)
-            document.detected_language = detected_language
-            # Update config language for processing
-            self.config.language = detected_language
+            document.detected_language = analysis.primary_language
         else:
             document.detected_language = self.config.language
 
-        # Detect individual block languages for mixed content
-        self.language_detector.detect_block_languages(document)
-
         # Remove SDH blocks and clean content if requested
         if self.config.remove_sdh:
             document = document.remove_sdh_blocks_and_clean_content()
 
         # Process all subtitle blocks
-        processed_document = self._process_document(document)
-
-        # Write output file
-        self.parser.write_file(
-            processed_document, output_path, encoding=self.config.force_encoding
-        )
-
-        return processed_document
+        return self._process_document(document)
 
     def check_file_only(self, input_path: str) -> dict:
         """Check subtitle file for compliance without processing.
@@ -86,18 +184,18 @@ class SRTProcessor:
             input_path, encoding=self.config.force_encoding
         )
 
-        # Detect language if auto mode
+        # Detect document and individual block languages in one pass
+        analysis = self.language_detector.analyze(document)
+        for block, block_language in zip(document.blocks, analysis.block_languages):
+            block.language = block_language
+
+        # Use the detected language if auto mode (the config is left as is;
+        # processors get the document language through _get_processor)
         if self.config.language == Language.AUTO:
-            detected_language = self.language_detector.detect_language(document)
-            document.detected_language = detected_language
-            # Update config language for validation
-            self.config.language = detected_language
+            document.detected_language = analysis.primary_language
         else:
             document.detected_language = self.config.language
 
-        # Detect individual block languages for mixed content
-        self.language_detector.detect_block_languages(document)
-
         # Remove SDH blocks and clean content if requested (for validation on final result)
         if self.config.remove_sdh:
             document = document.remove_sdh_blocks_and_clean_content()
@@ -116,7 +214,7 @@ class SRTProcessor:
 
         # Extract violation blocks with detailed information
         violation_blocks = self._extract_violation_blocks(
-            document, validation_results["warnings"]
+            document, validation_results["warnings"], validation_results["violations"]
         )
         validation_results["violation_blocks"] = violation_blocks
 
@@ -124,24 +222,19 @@ class SRTProcessor:
         char_warnings = []
         speed_warnings = []
 
-        for warning in validation_results["warnings"]:
-            if "character limit" in warning:
-                char_warnings.append(warning)
-            elif "Reading speed" in warning:
-                speed_warnings.append(warning)
+        for record in validation_results["violations"]:
+            if record["type"] == "character_limit":
+                char_warnings.append(record["message"])
+            elif record["type"] == "reading_speed":
+                speed_warnings.append(record["message"])
 
         validation_results["character_warnings"] = char_warnings
         validation_results["speed_warnings"] = speed_warnings
 
         # Calculate compliance rate
         total_blocks = validation_results["statistics"]["total_blocks"]
-        warning_blocks = len(
-            set(
-                warning.split(":")[0]
-                for warning in validation_results["warnings"]
-                if "Block" in warning
-            )
-        )
+        # One violation block per distinct block index with warnings
+        warning_blocks = len(violation_blocks)
         compliant_blocks = total_blocks - warning_blocks
         compliance_rate = (
             (compliant_blocks / total_blocks * 100) if total_blocks > 0 else 0
@@ -152,72 +245,100 @@ class SRTProcessor:
 
         return validation_results
 
-    def _extract_violation_blocks(self, document: SRTDocument, warnings: list) -> list:
+    def _extract_violation_blocks(
+        self,
+        document: SRTDocument,
+        warnings: list,
+        records: Optional[list] = None,
+    ) -> list:
         """Extract original subtitle blocks that have violations.
 
         Args:
             document: Original parsed document
-            warnings: List of validation warning strings
+            warnings: List of validation warning strings (parsed only when no
+                records are given)
+            records: Optional structured violation records from validate_document
 
         Returns:
             List of dictionaries with block data and associated violations
         """
-        import re
-
-        # Group warnings by block index
+        # Group warnings (and their structured records) by block index
         block_violations = {}
-
-        for warning in warnings:
-            # Extract block index from warning: "Block 10: Exceeds character limit..."
-            match = re.match(r"Block (\d+):", warning)
-            if match:
-                block_idx = int(match.group(1))
-                if block_idx not in block_violations:
-                    block_violations[block_idx] = []
-                block_violations[block_idx].append(warning)
-
-        # Build violation blocks list
+        block_records = {}
+
+        if records is not None:
+            # Records carry the block index of every warning
+            for record in records:
+                block_idx = record["block"]
+                block_violations.setdefault(block_idx, []).append(record["message"])
+                block_records.setdefault(block_idx, []).append(record)
+        else:
+            for warning in warnings:
+                # Extract block index from warning: "Block 10: Exceeds character limit..."
+                match = _WARNING_BLOCK_RE.match(warning)
+                if match:
+                    block_idx = int(match.group(1))
+                    block_violations.setdefault(block_idx, []).append(warning)
+
+        # Look blocks up by SRT index (1-based); the first block wins for
+        # duplicated indices
+        blocks_by_index = {}
+        for doc_block in document.blocks:
+            blocks_by_index.setdefault(doc_block.index, doc_block)
+
+        # Build violation blocks list, sorted by block index for consistent output
         violation_blocks = []
-        for block_idx, block_warnings in block_violations.items():
-            # Find the corresponding block (SRT indices are 1-based)
-            block = None
-            for doc_block in document.blocks:
-                if doc_block.index == block_idx:
-                    block = doc_block
-                    break
-
+        for block_idx, block_warnings in sorted(block_violations.items()):
+            block = blocks_by_index.get(block_idx)
             if block:
                 violation_blocks.append(
                     {
                         "block": block,
                         "violations": block_warnings,
+                        "records": block_records.get(block_idx, []),
                         "violation_types": self._categorize_violation_types(
-                            block_warnings
+                            block_warnings, block_records.get(block_idx)
                         ),
                     }
                 )
 
-        # Sort by block index for consistent output
-        violation_blocks.sort(key=lambda x: x["block"].index)
-
         return violation_blocks
 
-    def _categorize_violation_types(self, warnings: list) -> list:
+    def _categorize_violation_types(
+        self, warnings: list, records: Optional[list] = None
+    ) -> list:
         """Categorize violation types from warning messages.
 
         Args:
-            warnings: List of warning strings for a block
+            warnings: List of warning strings for a block (scanned only when
+                no records are given)
+            records: Optional structured violation records for the block
 
         Returns:
-            List of violation type strings
+            List of violation type strings (each type once, in a fixed order)
         """
+        # Only two types exist: remember which were seen with two flags
+        has_character_limit = has_reading_speed = False
+        if records:
+            # Records are tagged with their type, no need to scan messages
+            for record in records:
+                if record["type"] == "character_limit":
+                    has_character_limit = True
+                elif record["type"] == "reading_speed":
+                    has_reading_speed = True
+        else:
+            for warning in warnings:
+                if "character limit" in warning:
+                    has_character_limit = True
+                elif "Reading speed" in warning:
+                    has_reading_speed = True
+
         violation_types = []
-        for warning in warnings:
-            if "character limit" in warning:
-                violation_types.append("character_limit")
-            elif "Reading speed" in warning:
-                violation_types.append("reading_speed")
-        return list(set(violation_types))  # Remove duplicates
+        if has_character_limit:
+            violation_types.append("character_limit")
+        if has_reading_speed:
+            violation_types.append("reading_speed")
+        return violation_types
 
     def _process_document(self, document: SRTDocument) -> SRTDocument:
         """Process all blocks in a document.
@@ -228,28 +349,40 @@ class SRTProcessor:
         Returns:
             Processed SRT document with updated blocks
         """
-        processed_blocks = []
-
-        for block in document.blocks:
-            # Check if this is a bilingual block
-            if self._is_bilingual_block(block):
-                processed_block = self._process_bilingual_block(block)
-            else:
-                # Determine which processor to use for this block
-                block_language = (
-                    block.language or document.detected_language or Language.ENGLISH
-                )
-
-                # Get appropriate processor
-                processor_class = self.processors.get(block_language)
-                if processor_class:
-                    processor = processor_class(self.config)
-                    processed_block = processor.process_block(block)
-                else:
-                    # No specific processor available, use as-is
-                    processed_block = block
+        blocks = document.blocks
+        workers = self._block_worker_count(len(blocks))
 
-            processed_blocks.append(processed_block)
+        if workers > 1:
+            process_block = partial(
+                _process_block_in_worker, detected_language=document.detected_language
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_block_worker,
+                initargs=(self.config,),
+            ) as pool:
+                processed_blocks = list(
+                    pool.map(
+                        process_block,
+                        blocks,
+                        chunksize=max(1, len(blocks) // (8 * workers)),
+                    )
+                )
+        else:
+            # Detect the language of every line of the document in one batch
+            line_languages = iter(
+                self.language_detector.detect_lines_batch(
+                    [line for block in blocks for line in block.lines]
+                )
+            )
+            processed_blocks = [
+                self._process_block(
+                    block,
+                    document.detected_language,
+                    list(islice(line_languages, len(block.lines))),
+                )
+                for block in blocks
+            ]
 
         # Create new document with processed blocks
         processed_document = SRTDocument(
@@ -261,11 +394,96 @@ class SRTProcessor:
 
         return processed_document
 
-    def _is_bilingual_block(self, block: SubtitleBlock) -> bool:
+    def _get_processor(
+        self, language: Language, config_language: Optional[Language] = None
+    ) -> Optional[Any]:
+        """Get the (reused) language processor for a language.
+
+        Args:
+            language: Language whose processor to get
+            config_language: Optional language override for the processor's
+                config (defaults to sharing the current config)
+
+        Returns:
+            Processor instance, or None if the language has no processor
+        """
+        processor_class = self.processors.get(language)
+        if processor_class is None:
+            return None
+
+        # Processors hold on to the config they were built with
+        if self._processor_cache_config is not self.config:
+            self._processor_cache.clear()
+            self._processor_cache_config = self.config
+
+        key = (processor_class, config_language)
+        processor = self._processor_cache.get(key)
+        if processor is None:
+            config = self.config
+            if config_language is not None:
+                config = replace(config, language=config_language)
+            processor = processor_class(config)
+            self._processor_cache[key] = processor
+
+        return processor
+
+    def _block_worker_count(self, block_count: int) -> int:
+        """Get the number of worker processes to use for a document.
+
+        Args:
+            block_count: Number of blocks in the document
+
+        Returns:
+            Number of worker processes (1 to process serially)
+        """
+        if block_count < _PARALLEL_MIN_BLOCKS:
+            return 1
+
+        return max(1, self.config.max_workers or os.cpu_count() or 1)
+
+    def _process_block(
+        self,
+        block: SubtitleBlock,
+        detected_language: Optional[Language],
+        line_languages: Optional[List[Language]] = None,
+    ) -> SubtitleBlock:
+        """Process a single block with the processor for its language.
+
+        Args:
+            block: Subtitle block to process
+            detected_language: Detected language of the whole document
+            line_languages: Optional detected language of each line of the
+                block (detected here when not given)
+
+        Returns:
+            Processed subtitle block
+        """
+        if line_languages is None:
+            line_languages = self.language_detector.detect_lines_batch(block.lines)
+
+        # Check if this is a bilingual block
+        if self._is_bilingual_block(block, line_languages):
+            return self._process_bilingual_block(block, line_languages)
+
+        # Determine which processor to use for this block
+        block_language = block.language or detected_language or Language.ENGLISH
+
+        # Get appropriate processor
+        processor = self._get_processor(block_language, detected_language)
+        if processor:
+            return processor.process_block(block)
+
+        # No specific processor available, use as-is
+        return block
+
+    def _is_bilingual_block(
+        self, block: SubtitleBlock, line_languages: List[Language]
+    ) -> bool:
         """Check if a block contains multiple languages.
 
         Args:
             block: Subtitle block to check
+            line_languages: Detected language of each line of the block
 
         Returns:
             True if block contains multiple languages
@@ -274,9 +492,8 @@ class SRTProcessor:
             return False
 
         languages = set()
-        for line in block.lines:
+        for line, line_language in zip(block.lines, line_languages):
             if line.strip():
-                line_language = self.language_detector.detect_line_language(line)
                 languages.add(line_language)
 
                 # If we find more than one language, it's bilingual
@@ -285,15 +502,34 @@ class SRTProcessor:
 
         return False
 
-    def _process_bilingual_block(self, block: SubtitleBlock) -> SubtitleBlock:
+    def _process_bilingual_block(
+        self, block: SubtitleBlock, line_languages: List[Language]
+    ) -> SubtitleBlock:
         """Process a bilingual block by handling each line with appropriate processor.
 
         Args:
             block: Bilingual subtitle block
+            line_languages: Detected language of each line of the block
 
         Returns:
             Processed subtitle block
         """
+        lines = block.lines
+
+        # Most bilingual blocks are one line per language: a bilingual block
+        # with two non-empty lines has one group per line
+        if len(lines) == 2 and lines[0].strip() and lines[1].strip():
+            processed_lines = self._process_line_group(
+                block, [lines[0]], line_languages[0]
+            ) + self._process_line_group(block, [lines[1]], line_languages[1])
+            return SubtitleBlock(
+                index=block.index,
+                time_code=block.time_code,
+                lines=processed_lines,
+                language=block.language,
+                is_sdh=block.is_sdh,
+            )
+
         processed_lines = []
 
         # Group consecutive lines by language for better processing
@@ -305,8 +541,8 @@ class SRTProcessor:
                 i += 1
                 continue
 
-            # Detect language for this line
-            line_language = self.language_detector.detect_line_language(line)
+            # Language of this line (detected up front)
+            line_language = line_languages[i]
 
             # Collect consecutive lines of the same language
             consecutive_lines = [line]
@@ -316,36 +552,16 @@ class SRTProcessor:
                 if not next_line.strip():
                     j += 1
                     continue
-                next_language = self.language_detector.detect_line_language(next_line)
+                next_language = line_languages[j]
                 if next_language == line_language:
                     consecutive_lines.append(next_line)
                     j += 1
                 else:
                     break
 
-            # Process the group of consecutive lines
-            processor_class = self.processors.get(line_language)
-            if processor_class:
-                # Create a temporary block for processing the consecutive lines
-                temp_block = SubtitleBlock(
-                    index=block.index,
-                    time_code=block.time_code,
-                    lines=consecutive_lines,
-                    language=line_language,
-                    is_sdh=block.is_sdh,
-                )
-
-                # Create temporary config with the line's language
-                from dataclasses import replace
-
-                temp_config = replace(self.config, language=line_language)
-
-                processor = processor_class(temp_config)
-                processed_temp_block = processor.process_block(temp_block)
-                processed_lines.extend(processed_temp_block.lines)
-            else:
-                # No processor available, use lines as-is
-                processed_lines.extend(consecutive_lines)
+            processed_lines.extend(
+                self._process_line_group(block, consecutive_lines, line_language)
+            )
 
             # Move to the next unprocessed line
             i = j
@@ -359,6 +575,36 @@ class SRTProcessor:
             is_sdh=block.is_sdh,
         )
 
+    def _process_line_group(
+        self, block: SubtitleBlock, lines: List[str], language: Language
+    ) -> List[str]:
+        """Process consecutive lines of a bilingual block sharing one language.
+
+        Args:
+            block: Bilingual subtitle block the lines belong to
+            lines: Lines to process
+            language: Detected language of the lines
+
+        Returns:
+            Processed lines
+        """
+        # Use a processor whose config uses the lines' language
+        processor = self._get_processor(language, language)
+        if not processor:
+            # No processor available, use lines as-is
+            return lines
+
+        # Create a temporary block for processing the consecutive lines
+        temp_block = SubtitleBlock(
+            index=block.index,
+            time_code=block.time_code,
+            lines=lines,
+            language=language,
+            is_sdh=block.is_sdh,
+        )
+
+        return processor.process_block(temp_block).lines
+
     def validate_document(self, document: SRTDocument) -> Dict[str, any]:
         """Validate a processed document for compliance.
 
@@ -371,49 +617,95 @@ class SRTProcessor:
         validation_results = {
             "valid": True,
             "warnings": [],
+            "violations": [],
             "errors": [],
             "statistics": {},
         }
 
+        # Limits only depend on the language, so look them up once
+        char_limits = {
+            language: self.config.get_character_limit(language) for language in Language
+        }
+        speed_limits = {
+            language: self.config.get_reading_speed_limit(language)
+            for language in Language
+        }
+
+        # Reading speeds of all blocks, computed together
+        if not self.config.no_speed_check:
+            reading_speeds = document.get_reading_speeds()
+
+        # Detect the language of every line up front, in one batch
+        line_languages = iter(
+            self.language_detector.detect_lines_batch(
+                [line for block in document.blocks for line in block.lines]
+            )
+        )
+
         # Validate each block
         for i, block in enumerate(document.blocks):
+            block_line_languages = list(islice(line_languages, len(block.lines)))
             block_language = (
                 block.language or document.detected_language or Language.ENGLISH
             )
 
             # Get appropriate processor for validation
-            processor_class = self.processors.get(block_language)
-            if processor_class:
-                processor = processor_class(self.config)
+            processor = self._get_processor(block_language, document.detected_language)
+            if processor:
 
                 # Character limit validation (per line with individual language detection)
-                for line_idx, line in enumerate(block.lines):
+                for line_idx, (line, line_language) in enumerate(
+                    zip(block.lines, block_line_languages)
+                ):
                     # Skip empty lines or lines with only whitespace
                     if not line.strip():
                         continue
 
-                    # Detect language for each line individually for bilingual support
-                    line_language = self.language_detector.detect_line_language(line)
-                    char_limit = self.config.get_character_limit(line_language)
+                    # Each line has its own language for bilingual support
+                    char_limit = char_limits[line_language]
                     line_char_count = len(line)
 
                     if line_char_count > char_limit:
-                        validation_results["warnings"].append(
+                        message = (
                             f"Block {block.index}: Line {line_idx + 1} exceeds character limit "
                             f"({line_char_count} > {char_limit} {line_language.value})"
                         )
+                        validation_results["warnings"].append(message)
+                        validation_results["violations"].append(
+                            {
+                                "type": "character_limit",
+                                "block": block.index,
+                                "line": line_idx + 1,
+                                "actual": line_char_count,
+                                "limit": char_limit,
+                                "language": line_language.value,
+                                "message": message,
+                            }
+                        )
 
-                # Reading speed validation
+                # Reading speed validation (the check of the processor's
+                # validate_reading_speed, on the precomputed speed; processor
+                # configs only differ from this one in their language)
                 if not self.config.no_speed_check:
-                    if not processor.validate_reading_speed(block):
-                        speed_limit = self.config.get_reading_speed_limit(
-                            block_language
-                        )
-                        actual_speed = block.get_reading_speed()
-                        validation_results["warnings"].append(
+                    actual_speed = reading_speeds[i]
+                    if actual_speed > speed_limits[processor.config.language]:
+                        speed_limit = speed_limits[block_language]
+                        message = (
                             f"Block {block.index}: Reading speed too fast "
                             f"({actual_speed:.1f} > {speed_limit} chars/sec)"
                         )
+                        validation_results["warnings"].append(message)
+                        validation_results["violations"].append(
+                            {
+                                "type": "reading_speed",
+                                "block": block.index,
+                                "line": None,
+                                "actual": actual_speed,
+                                "limit": speed_limit,
+                                "language": block_language.value,
+                                "message": message,
+                            }
+                        )
 
         # Calculate statistics
         validation_results["statistics"] = {
@@ -431,3 +723,27 @@ class SRTProcessor:
         validation_results["valid"] = len(validation_results["errors"]) == 0
 
         return validation_results
+
+
+def _init_block_worker(config: ProcessingConfig) -> None:
+    """Create the shared SRT processor of a block worker process.
+
+    Args:
+        config: Processing configuration (pickled once per worker)
+    """
+    _block_worker["processor"] = SRTProcessor(config)
+
+
+def _process_block_in_worker(
+    block: SubtitleBlock, detected_language: Optional[Language]
+) -> SubtitleBlock:
+    """Process one block in a worker process (see _init_block_worker).
+
+    Args:
+        block: Subtitle block to process
+        detected_language: Detected language of the whole document
+
+    Returns:
+        Processed subtitle block
+    """
+    return _block_worker["processor"]._process_block(block, detected_language)
@@ -1,10 +1,79 @@
 """SRT subtitle data models."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Characters every match of the is_sdh_marker / is_sdh_only_block patterns
+# starts with, checked with cheap substring tests before running the regexes
+_SDH_MARKER_CHARS = ("♪", "[", "(", "【", "《")
+_SDH_ONLY_CHARS = ("♪", "🎵", "🎶", "[", "(", "（", "【", "《", "［", "〔", "〈")
+
+# SDH markers detected by SubtitleBlock.is_sdh_marker
+_SDH_MARKER_RES = tuple(
+    re.compile(pattern)
+    for pattern in (r"♪", r"\[.*?\]", r"\(.*?\)", r"【.*?】", r"《.*?》")
+)
+
+# Whole-block SDH content for SubtitleBlock.is_sdh_only_block
+_SDH_ONLY_BLOCK_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # Music markers
+        r"^♪+$",
+        r"^🎵+$",
+        r"^🎶+$",
+        # Audio descriptions
+        r"^\[\s*.*?\s*\]$",  # Pure audio descriptions like [Music plays]
+        r"^\(\s*.*?\s*\)$",  # Sound effects in ASCII parentheses
+        r"^（\s*.*?\s*）$",  # Sound effects in full-width parentheses
+        r"^【\s*.*?\s*】$",  # Chinese-style audio descriptions
+        r"^《\s*.*?\s*》$",  # Chinese-style audio descriptions
+        r"^［\s*.*?\s*］$",  # Full-width square brackets
+        r"^〔\s*.*?\s*〕$",  # Japanese/Chinese square brackets
+        r"^〈\s*.*?\s*〉$",  # Angle brackets
+    )
+)
+
+# Music markers and audio descriptions removed from a line when checking it
+# for dialogue content (no music marker starts a description, so one pass
+# removes the same text as removing music markers first)
+_SDH_CONTENT_RE = re.compile(r"♪+|🎵+|🎶+|\[.*?\]|\(.*?\)|【.*?】|《.*?》")
+
+# SDH markers stripped from dialogue lines by SubtitleBlock._remove_sdh_from_line,
+# in order, each with the character every match starts with
+_SDH_STRIP_RES = tuple(
+    (opening, re.compile(pattern))
+    for opening, pattern in (
+        # Audio descriptions in square brackets (ASCII)
+        ("[", r"\[\s*[^\]]*\s*\]"),
+        # Audio descriptions in parentheses (ASCII)
+        ("(", r"\(\s*[^)]*\s*\)"),
+        # Audio descriptions in full-width parentheses (Unicode/Chinese)
+        ("（", r"（\s*[^）]*\s*）"),
+        # Chinese-style audio descriptions
+        ("【", r"【\s*[^】]*\s*】"),
+        ("《", r"《\s*[^》]*\s*》"),
+        # Music markers (Unicode and ASCII)
+        ("♪", r"♪+"),
+        ("🎵", r"🎵+"),
+        ("🎶", r"🎶+"),
+        # Additional Unicode brackets/parentheses variants
+        ("［", r"［\s*[^］]*\s*］"),  # Full-width square brackets
+        ("〔", r"〔\s*[^〕]*\s*〕"),  # Japanese/Chinese square brackets
+        ("〈", r"〈\s*[^〉]*\s*〉"),  # Angle brackets
+        # Japanese quotation marks (sometimes used for SDH)
+        ("「", r"「\s*[^」]*\s*」"),
+    )
+)
 
 
 class Language(Enum):
@@ -24,10 +93,47 @@ class ContentType(Enum):
     CHILDREN = "children"
 
 
+# SRT time ("00:01:13,933") and time code ("<start> --> <end>") formats
+_SRT_TIME_FORMAT = "%02d:%02d:%02d,%03d"
+_SRT_TIME_CODE_FORMAT = f"{_SRT_TIME_FORMAT} --> {_SRT_TIME_FORMAT}"
+
+# Character limits per line for each language (other languages: 42)
+_CHARACTER_LIMITS = {
+    Language.CHINESE: 16,
+    Language.ENGLISH: 42,
+    Language.KOREAN: 16,
+    Language.JAPANESE: 13,
+}
+_SDH_CHARACTER_LIMITS = {
+    **_CHARACTER_LIMITS,
+    Language.CHINESE: 18,
+    Language.JAPANESE: 16,
+}
+
+# Reading speed limits in chars/second for each language (other languages: 20)
+_ADULT_READING_SPEEDS = {
+    Language.CHINESE: 9.0,
+    Language.ENGLISH: 20.0,
+    Language.KOREAN: 12.0,
+    Language.JAPANESE: 4.0,
+}
+_CHILDREN_READING_SPEEDS = {
+    Language.CHINESE: 7.0,
+    Language.ENGLISH: 17.0,
+    Language.KOREAN: 9.0,
+    Language.JAPANESE: 4.0,
+}
+_SDH_ADULT_READING_SPEEDS = {**_ADULT_READING_SPEEDS, Language.JAPANESE: 7.0}
+_SDH_CHILDREN_READING_SPEEDS = {**_CHILDREN_READING_SPEEDS, Language.JAPANESE: 7.0}
+
+
 @dataclass
 class TimeCode:
     """SRT time code representation."""
 
+    # One per block: no per-instance __dict__
+    __slots__ = ("start", "end")
+
     start: timedelta
     end: timedelta
 
@@ -39,32 +145,70 @@ class TimeCode:
         end = cls._parse_time(end_str)
         return cls(start=start, end=end)
 
+    @classmethod
+    def from_fields(
+        cls,
+        start_hours: int,
+        start_minutes: int,
+        start_seconds: int,
+        start_milliseconds: int,
+        end_hours: int,
+        end_minutes: int,
+        end_seconds: int,
+        end_milliseconds: int,
+    ) -> "TimeCode":
+        """Build a time code from already parsed hour/minute/second/ms fields"""
+        # Positional (days, seconds, microseconds) is the cheapest constructor
+        return cls(
+            start=timedelta(
+                0,
+                start_hours * 3600 + start_minutes * 60 + start_seconds,
+                start_milliseconds * 1000,
+            ),
+            end=timedelta(
+                0,
+                end_hours * 3600 + end_minutes * 60 + end_seconds,
+                end_milliseconds * 1000,
+            ),
+        )
+
     @staticmethod
     def _parse_time(time_str: str) -> timedelta:
         """Parse individual time: 00:01:13,933"""
         hours, minutes, seconds_ms = time_str.split(":")
         seconds, milliseconds = seconds_ms.split(",")
 
+        # Positional (days, seconds, microseconds) with integer math
         return timedelta(
-            hours=int(hours),
-            minutes=int(minutes),
-            seconds=int(seconds),
-            milliseconds=int(milliseconds),
+            0,
+            int(hours) * 3600 + int(minutes) * 60 + int(seconds),
+            int(milliseconds) * 1000,
         )
 
     def to_srt_format(self) -> str:
         """Convert back to SRT time format."""
-        return f"{self._format_time(self.start)} --> {self._format_time(self.end)}"
+        return _SRT_TIME_CODE_FORMAT % (
+            *self._time_fields(self.start),
+            *self._time_fields(self.end),
+        )
 
     def _format_time(self, td: timedelta) -> str:
         """Format timedelta to SRT time format."""
-        total_seconds = int(td.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        milliseconds = td.microseconds // 1000
+        return _SRT_TIME_FORMAT % self._time_fields(td)
 
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    @staticmethod
+    def _time_fields(td: timedelta) -> Tuple[int, int, int, int]:
+        """Split a timedelta into SRT hours, minutes, seconds and milliseconds."""
+        if td.days >= 0:
+            # Whole seconds straight from the fields, without a float round trip
+            total_seconds = td.days * 86400 + td.seconds
+        else:
+            # Negative times (never parsed from SRT) truncate towards zero
+            total_seconds = int(td.total_seconds())
+
+        minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return hours, minutes, seconds, td.microseconds // 1000
 
     @property
     def duration(self) -> timedelta:
@@ -82,12 +226,14 @@ class SubtitleBlock:
     language: Optional[Language] = None
     is_sdh: bool = False
 
-    @property
+    # text and character_count are computed on first use and then kept:
+    # blocks are not modified after construction (processing builds new ones)
+    @cached_property
     def text(self) -> str:
         """Get combined text of all lines."""
         return "\n".join(self.lines)
 
-    @property
+    @cached_property
     def character_count(self) -> int:
         """Get total character count across all lines."""
         return sum(len(line) for line in self.lines)
@@ -98,9 +244,11 @@ class SubtitleBlock:
 
     def is_sdh_marker(self) -> bool:
         """Check if this contains SDH markers like ♪ or [sound]."""
-        sdh_patterns = [r"♪", r"\[.*?\]", r"\(.*?\)", r"【.*?】", r"《.*?》"]
         text = self.text
-        return any(re.search(pattern, text) for pattern in sdh_patterns)
+        # Dialogue without any marker character needs no regex search
+        if not any(char in text for char in _SDH_MARKER_CHARS):
+            return False
+        return any(pattern.search(text) for pattern in _SDH_MARKER_RES)
 
     def is_sdh_only_block(self) -> bool:
         """Check if this block contains ONLY SDH markers without dialogue content.
@@ -124,27 +272,14 @@ class SubtitleBlock:
         if not full_text:
             return False
 
-        # Enhanced SDH patterns
-        music_patterns = [r"^♪+$", r"^🎵+$", r"^🎶+$"]
-        audio_description_patterns = [
-            r"^\[\s*.*?\s*\]$",  # Pure audio descriptions like [Music plays]
-            r"^\(\s*.*?\s*\)$",  # Sound effects in ASCII parentheses
-            r"^（\s*.*?\s*）$",  # Sound effects in full-width parentheses
-            r"^【\s*.*?\s*】$",  # Chinese-style audio descriptions
-            r"^《\s*.*?\s*》$",  # Chinese-style audio descriptions
-            r"^［\s*.*?\s*］$",  # Full-width square brackets
-            r"^〔\s*.*?\s*〕$",  # Japanese/Chinese square brackets
-            r"^〈\s*.*?\s*〉$",  # Angle brackets
-        ]
-
-        # Check if entire block is just music markers
-        for pattern in music_patterns:
-            if re.match(pattern, full_text):
-                return True
+        # Without marker characters none of the patterns below can match, and
+        # only lines holding a lone dialogue marker count as SDH content
+        if not any(char in full_text for char in _SDH_ONLY_CHARS):
+            return all(line.strip() in ("", "-") for line in self.lines)
 
-        # Check if entire block is just audio descriptions
-        for pattern in audio_description_patterns:
-            if re.match(pattern, full_text):
+        # Check if entire block is just music markers or audio descriptions
+        for pattern in _SDH_ONLY_BLOCK_RES:
+            if pattern.match(full_text):
                 return True
 
         # Check each line individually for pure SDH content
@@ -158,21 +293,17 @@ class SubtitleBlock:
                 continue
 
             # Check if line contains any actual dialogue content
-            # Remove SDH markers and see if meaningful content remains
-            temp_line = line
-
-            # Remove music markers
-            temp_line = re.sub(r"♪+|🎵+|🎶+", "", temp_line)
-
-            # Remove audio descriptions
-            temp_line = re.sub(r"\[.*?\]|\(.*?\)|【.*?】|《.*?》", "", temp_line)
+            # Remove SDH markers (music markers and audio descriptions) and see
+            # if meaningful content remains
+            temp_line = _SDH_CONTENT_RE.sub("", line)
 
             # Remove dialogue markers and whitespace
-            temp_line = re.sub(r"^-\s*", "", temp_line).strip()
+            if temp_line.startswith("-"):
+                temp_line = temp_line[1:]
 
             # If anything meaningful remains after removing SDH markers,
             # this is not an SDH-only block
-            if temp_line and len(temp_line) > 0:
+            if temp_line.strip():
                 return False
 
         # If we get here, all lines were pure SDH content
@@ -224,33 +355,13 @@ class SubtitleBlock:
         Returns:
             Cleaned line with SDH markers removed
         """
-        # Enhanced SDH marker patterns with Unicode support
-        sdh_patterns = [
-            # Audio descriptions in square brackets (ASCII)
-            r"\[\s*[^\]]*\s*\]",
-            # Audio descriptions in parentheses (ASCII)
-            r"\(\s*[^)]*\s*\)",
-            # Audio descriptions in full-width parentheses (Unicode/Chinese)
-            r"（\s*[^）]*\s*）",
-            # Chinese-style audio descriptions
-            r"【\s*[^】]*\s*】",
-            r"《\s*[^》]*\s*》",
-            # Music markers (Unicode and ASCII)
-            r"♪+",
-            r"🎵+",
-            r"🎶+",
-            # Additional Unicode brackets/parentheses variants
-            r"［\s*[^］]*\s*］",  # Full-width square brackets
-            r"〔\s*[^〕]*\s*〕",  # Japanese/Chinese square brackets
-            r"〈\s*[^〉]*\s*〉",  # Angle brackets
-            r"「\s*[^」]*\s*」",  # Japanese quotation marks (sometimes used for SDH)
-        ]
-
         cleaned = line
 
-        # Remove all SDH patterns iteratively
-        for pattern in sdh_patterns:
-            cleaned = re.sub(pattern, "", cleaned)
+        # Remove all SDH patterns iteratively (most lines have no markers, so
+        # skip patterns whose opening character does not occur)
+        for opening, pattern in _SDH_STRIP_RES:
+            if opening in cleaned:
+                cleaned = pattern.sub("", cleaned)
 
         # Clean up whitespace and formatting
         cleaned = self._clean_whitespace(cleaned)
@@ -266,17 +377,20 @@ class SubtitleBlock:
         Returns:
             Text with normalized whitespace
         """
-        # Remove extra spaces
-        cleaned = re.sub(r"\s+", " ", text)
+        # Remove extra spaces and leading/trailing whitespace
+        cleaned = " ".join(text.split())
 
-        # Fix dialogue marker spacing: "- text" or "-text" → "- text"
-        cleaned = re.sub(r"^-\s*", "- ", cleaned)
+        # Dialogue markers are only fixed when the text starts with one
+        # (not when whitespace comes first)
+        if cleaned.startswith("-") and not text[0].isspace():
+            # Fix dialogue marker spacing: "- text" or "-text" → "- text"
+            rest = cleaned[2:] if cleaned.startswith("- ") else cleaned[1:]
 
-        # Fix multiple dashes that can occur after SDH removal: "- -text" → "- text"
-        cleaned = re.sub(r"^-\s*-\s*", "- ", cleaned)
+            # Fix multiple dashes that can occur after SDH removal: "- -text" → "- text"
+            if rest.startswith("-"):
+                rest = rest[2:] if rest.startswith("- ") else rest[1:]
 
-        # Remove leading/trailing whitespace
-        cleaned = cleaned.strip()
+            cleaned = "- " + rest if rest else "-"
 
         # Handle case where only dialogue marker remains
         if cleaned == "-":
@@ -300,6 +414,7 @@ class SRTDocument:
     source_file: Optional[str] = None
     detected_language: Optional[Language] = None
     encoding: str = "utf-8"
+    validation: Optional[dict] = field(default=None, repr=False, compare=False)
 
     @property
     def total_blocks(self) -> int:
@@ -318,6 +433,29 @@ class SRTDocument:
         """Get all SDH marker blocks."""
         return [block for block in self.blocks if block.is_sdh_marker()]
 
+    def get_reading_speeds(self) -> List[float]:
+        """Get the reading speed of every block in characters per second.
+
+        Returns:
+            Same values as each block's get_reading_speed, in block order
+        """
+        if np is None:
+            return [block.get_reading_speed() for block in self.blocks]
+
+        # Gather the counts and durations, then divide them all at once
+        count = len(self.blocks)
+        char_counts = np.fromiter(
+            (block.character_count for block in self.blocks), np.float64, count
+        )
+        durations = np.fromiter(
+            (block.time_code.duration.total_seconds() for block in self.blocks),
+            np.float64,
+            count,
+        )
+        speeds = np.zeros(count)
+        np.divide(char_counts, durations, out=speeds, where=durations > 0)
+        return speeds.tolist()
+
     def get_sdh_only_blocks(self) -> List[SubtitleBlock]:
         """Get all blocks that contain only SDH markers (no dialogue)."""
         return [block for block in self.blocks if block.is_sdh_only_block()]
@@ -331,14 +469,12 @@ class SRTDocument:
         Returns:
             New SRTDocument with filtered blocks and resorted indices
         """
-        # Filter out SDH-only blocks
-        filtered_blocks = [
-            block for block in self.blocks if not block.is_sdh_only_block()
-        ]
-
-        # Resort indices sequentially
-        for i, block in enumerate(filtered_blocks):
-            block.index = i + 1
+        # Filter out SDH-only blocks, resorting indices sequentially as we go
+        filtered_blocks = []
+        for block in self.blocks:
+            if not block.is_sdh_only_block():
+                block.index = len(filtered_blocks) + 1
+                filtered_blocks.append(block)
 
         # Create new document with filtered blocks
         return SRTDocument(
@@ -367,18 +503,13 @@ class SRTDocument:
                 continue
 
             # For mixed content blocks, clean SDH markers but preserve dialogue
+            # (clean_sdh_markers only keeps non-blank lines)
             cleaned_block = block.clean_sdh_markers()
-            if (
-                cleaned_block
-                and cleaned_block.lines
-                and any(line.strip() for line in cleaned_block.lines)
-            ):
+            if cleaned_block.lines:
+                # Resort indices sequentially
+                cleaned_block.index = len(processed_blocks) + 1
                 processed_blocks.append(cleaned_block)
 
-        # Resort indices sequentially
-        for i, block in enumerate(processed_blocks):
-            block.index = i + 1
-
         # Create new document with processed blocks
         return SRTDocument(
             blocks=processed_blocks,
@@ -389,14 +520,22 @@ class SRTDocument:
 
     def to_srt_format(self) -> str:
         """Convert document back to SRT format."""
-        result = []
+        # Same lines as iter_srt_lines, collected with one extend per block
+        parts = []
+        extend = parts.extend
         for block in self.blocks:
-            result.append(str(block.index))
-            result.append(block.time_code.to_srt_format())
-            result.extend(block.lines)
-            result.append("")  # Empty line between blocks
+            extend(
+                (str(block.index), block.time_code.to_srt_format(), *block.lines, "")
+            )
+        return "\n".join(parts)
 
-        return "\n".join(result)
+    def iter_srt_lines(self) -> Iterator[str]:
+        """Yield the lines of the SRT format (without line endings)."""
+        for block in self.blocks:
+            yield str(block.index)
+            yield block.time_code.to_srt_format()
+            yield from block.lines
+            yield ""  # Empty line between blocks
 
 
 @dataclass
@@ -414,34 +553,24 @@ class ProcessingConfig:
     check_only: bool = False
     output_violation: Optional[str] = None
     remove_sdh: bool = True
+    use_cache: bool = True
+    max_workers: Optional[int] = 1  # Block processing processes (None: CPU count)
 
     def get_character_limit(self, language: Language) -> int:
         """Get character limit for specified language."""
-        limits = {
-            Language.CHINESE: 18 if self.sdh_mode else 16,
-            Language.ENGLISH: 42,
-            Language.KOREAN: 16,
-            Language.JAPANESE: 16 if self.sdh_mode else 13,
-        }
+        limits = _SDH_CHARACTER_LIMITS if self.sdh_mode else _CHARACTER_LIMITS
         return limits.get(language, 42)
 
     def get_reading_speed_limit(self, language: Language) -> float:
         """Get reading speed limit in chars/second for language and content type."""
-        adult_speeds = {
-            Language.CHINESE: 9.0,
-            Language.ENGLISH: 20.0,
-            Language.KOREAN: 12.0,
-            Language.JAPANESE: 7.0 if self.sdh_mode else 4.0,
-        }
-
-        children_speeds = {
-            Language.CHINESE: 7.0,
-            Language.ENGLISH: 17.0,
-            Language.KOREAN: 9.0,
-            Language.JAPANESE: 7.0 if self.sdh_mode else 4.0,
-        }
-
-        speeds = (
-            adult_speeds if self.content_type == ContentType.ADULT else children_speeds
-        )
+        if self.content_type == ContentType.ADULT:
+            speeds = (
+                _SDH_ADULT_READING_SPEEDS if self.sdh_mode else _ADULT_READING_SPEEDS
+            )
+        else:
+            speeds = (
+                _SDH_CHILDREN_READING_SPEEDS
+                if self.sdh_mode
+                else _CHILDREN_READING_SPEEDS
+            )
         return speeds.get(language, 20.0)
@@ -1,10 +1,14 @@
 """Chinese subtitle processing with intelligent line breaking."""
 
-import re
-from typing import List
+from typing import List, Optional
 
 from ..models.subtitle import ProcessingConfig, SubtitleBlock
 
+# Kinds of line break positions, in order of preference
+_BREAK_AFTER_HELPER = 3
+_BREAK_AFTER_PUNCT = 2
+_BREAK_AT_SPACE = 1
+
 
 class ChineseProcessor:
     """Processor for Chinese subtitles with v2.0 intelligent features."""
@@ -17,8 +21,12 @@ class ChineseProcessor:
         """
         self.config = config
 
+        # Character limit for the config language, refreshed by process_block
+        # since the config can be changed after construction
+        self._char_limit = config.get_character_limit(config.language)
+
         # Chinese punctuation marks
-        self.punctuation = "。！？，：；" "''（）【】《》"
+        self.punctuation = frozenset("。！？，：；'（）【】《》")
 
         # Helper words for intelligent line breaking (助词)
         self.helper_words = {
@@ -38,10 +46,28 @@ class ChineseProcessor:
         }
 
         # Sentence ending punctuation
-        self.sentence_endings = "。！？"
+        self.sentence_endings = frozenset("。！？")
+
+        # Trailing marks and connecting words that suggest a sentence continues
+        self.continuation_indicators = frozenset(
+            {
+                "，",
+                "、",
+                "和",
+                "或",
+                "但",
+                "而",
+                "因为",
+                "所以",
+                "如果",
+                "那么",
+            }
+        )
 
-        # Dialogue marker pattern
-        self.dialogue_pattern = re.compile(r"^-\s*(.*)$")
+        # Break candidates by preference (helper words, punctuation, spaces)
+        self._break_rank = dict.fromkeys(self.helper_words, _BREAK_AFTER_HELPER)
+        self._break_rank.update(dict.fromkeys(self.punctuation, _BREAK_AFTER_PUNCT))
+        self._break_rank[" "] = _BREAK_AT_SPACE
 
     def process_block(self, block: SubtitleBlock) -> SubtitleBlock:
         """Process a Chinese subtitle block.
@@ -55,20 +81,51 @@ class ChineseProcessor:
         if not block.lines:
             return block
 
-        # Process dialogue formatting first
-        processed_lines = self._process_dialogue_format(block.lines)
+        self._char_limit = self.config.get_character_limit(self.config.language)
+
+        # Single pass: dialogue formatting, smart merging and line breaking.
+        # The first line is held back until a second one shows up, since
+        # lines are only merged (and re-stripped) in multi-line blocks.
+        processed_lines: List[str] = []
+        first_line: Optional[str] = None
+        current_line = ""
+
+        for line in block.lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Add a space after a leading dialogue dash
+            if line.startswith("-"):
+                line = f"- {line[1:].strip()}"
 
-        # Smart merge if multiple lines
-        if len(processed_lines) > 1:
-            processed_lines = self._smart_merge_lines(processed_lines)
+            if first_line is None:
+                first_line = line
+                continue
+            if not current_line:
+                current_line = first_line.strip()
 
-        # Apply intelligent line breaking
-        processed_lines = self._apply_line_breaking(processed_lines)
+            line = line.strip()
+            if self._should_merge_with_current(current_line, line):
+                # For Chinese, merge without space
+                current_line += line
+            else:
+                processed_lines.extend(self._break_line_intelligently(current_line))
+                current_line = line
+
+        if current_line:
+            processed_lines.extend(self._break_line_intelligently(current_line))
+        elif first_line is not None:
+            processed_lines.extend(self._break_line_intelligently(first_line))
 
         # Add missing punctuation if enabled
         if not self.config.no_punct_fix:
             processed_lines = self._add_missing_punctuation(processed_lines)
 
+        # Keep the block when processing changed nothing
+        if processed_lines == block.lines:
+            return block
+
         # Create new block with processed lines
         new_block = SubtitleBlock(
             index=block.index,
@@ -80,71 +137,6 @@ class ChineseProcessor:
 
         return new_block
 
-    def _process_dialogue_format(self, lines: List[str]) -> List[str]:
-        """Process dialogue format by adding spaces after dashes.
-
-        Args:
-            lines: Original lines
-
-        Returns:
-            Lines with proper dialogue formatting
-        """
-        processed_lines = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check if line starts with dash
-            match = self.dialogue_pattern.match(line)
-            if match:
-                content = match.group(1).strip()
-                processed_lines.append(f"- {content}")
-            else:
-                processed_lines.append(line)
-
-        return processed_lines
-
-    def _smart_merge_lines(self, lines: List[str]) -> List[str]:
-        """Smart merge multiple lines based on Chinese rules.
-
-        Args:
-            lines: Input lines
-
-        Returns:
-            Merged lines
-        """
-        if len(lines) <= 1:
-            return lines
-
-        merged_lines = []
-        current_line = ""
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check if we should merge with current line
-            if self._should_merge_with_current(current_line, line):
-                if current_line:
-                    # For Chinese, merge without space
-                    current_line += line
-                else:
-                    current_line = line
-            else:
-                # Start new line
-                if current_line:
-                    merged_lines.append(current_line)
-                current_line = line
-
-        # Add the last line
-        if current_line:
-            merged_lines.append(current_line)
-
-        return merged_lines
-
     def _should_merge_with_current(self, current: str, next_line: str) -> bool:
         """Determine if next line should be merged with current.
 
@@ -170,31 +162,11 @@ class ChineseProcessor:
 
         # Check character count after merging
         merged_length = len(current) + len(next_line)
-        char_limit = self.config.get_character_limit(self.config.language)
+        char_limit = self._char_limit
 
         # Merge if it would fit within limits
         return merged_length <= char_limit
 
-    def _apply_line_breaking(self, lines: List[str]) -> List[str]:
-        """Apply intelligent line breaking to Chinese text.
-
-        Args:
-            lines: Input lines
-
-        Returns:
-            Lines with intelligent breaking applied
-        """
-        result_lines = []
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            broken_lines = self._break_line_intelligently(line)
-            result_lines.extend(broken_lines)
-
-        return result_lines
-
     def _break_line_intelligently(self, line: str) -> List[str]:
         """Break a single line intelligently based on Chinese rules.
 
@@ -204,38 +176,37 @@ class ChineseProcessor:
         Returns:
             List of broken lines
         """
-        char_limit = self.config.get_character_limit(self.config.language)
-
-        # If line fits within limit, return as-is
-        if len(line) <= char_limit:
-            return [line]
+        char_limit = self._char_limit
+        result = []
 
-        # Apply v2.0 threshold rule: don't break if remaining < 3 chars
-        remaining_chars = len(line) - char_limit
-        if remaining_chars < 3:
-            return [line]  # Don't break
+        # Keep breaking off first parts while the rest exceeds the limit; every
+        # break shortens the rest (position 0 is only used for a leading space)
+        while len(line) > char_limit:
+            # Apply v2.0 threshold rule: don't break if remaining < 3 chars
+            remaining_chars = len(line) - char_limit
+            if remaining_chars < 3:
+                break  # Don't break
 
-        # Find best break position
-        break_pos = self._find_best_break_position(line, char_limit)
+            # Find best break position
+            break_pos = self._find_best_break_position(line, char_limit)
 
-        if break_pos == -1:
-            # No good break position found, force break at limit
-            break_pos = char_limit
+            if break_pos == -1:
+                # No good break position found, force break at limit
+                break_pos = char_limit
 
-        # Split the line
-        first_part = line[:break_pos].rstrip()
-        second_part = line[break_pos:].lstrip()
+            # Split the line
+            first_part = line[:break_pos].rstrip()
+            second_part = line[break_pos:].lstrip()
 
-        # Ensure second part meets minimum length requirement (≥5 chars)
-        if len(second_part) < 5:
-            # If second part too short, don't break
-            return [line]
+            # Ensure second part meets minimum length requirement (≥5 chars)
+            if len(second_part) < 5:
+                # If second part too short, don't break
+                break
 
-        # Recursively break the second part if needed (with safety check)
-        result = [first_part]
-        if second_part and len(second_part) < len(line):  # Prevent infinite recursion
-            result.extend(self._break_line_intelligently(second_part))
+            result.append(first_part)
+            line = second_part
 
+        result.append(line)
         return result
 
     def _find_best_break_position(self, line: str, limit: int) -> int:
@@ -252,28 +223,31 @@ class ChineseProcessor:
         search_start = max(0, limit - 10)  # Look within 10 chars of limit
         search_end = min(len(line), limit + 3)  # Don't go too far past limit
 
-        # 1. Look for helper words (的、地、得等) near the limit
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] in self.helper_words:
-                # Break after the helper word
-                if i + 1 <= limit:
-                    return i + 1
+        # Scan backwards once, keeping the last punctuation mark and space;
+        # breaks must not go past the limit, so later characters can't be used
+        punct_break = space_break = -1
+        for i in range(min(search_end, limit + 1) - 1, search_start - 1, -1):
+            rank = self._break_rank.get(line[i])
+            if rank is None:
+                continue
 
-        # 2. Look for punctuation marks
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] in self.punctuation:
-                # Break after punctuation
-                if i + 1 <= limit:
+            if rank == _BREAK_AFTER_HELPER:
+                # 1. Break after the helper word (的、地、得等) nearest the limit
+                if i < limit:
                     return i + 1
+            elif rank == _BREAK_AFTER_PUNCT:
+                # 2. Break after punctuation
+                if punct_break == -1 and i < limit:
+                    punct_break = i + 1
+            elif space_break == -1:
+                # 3. Break at a space (less common in Chinese but possible)
+                space_break = i
 
-        # 3. Look for spaces (less common in Chinese but possible)
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] == " ":
-                if i <= limit:
-                    return i
+        if punct_break != -1:
+            return punct_break
 
-        # 4. No good position found
-        return -1
+        # -1 if no good position was found
+        return space_break
 
     def _add_missing_punctuation(self, lines: List[str]) -> List[str]:
         """Add missing sentence-ending punctuation only to complete sentences.
@@ -287,8 +261,7 @@ class ChineseProcessor:
         if not lines:
             return lines
 
-        result_lines = lines.copy()
-        last_line = result_lines[-1].strip()
+        last_line = lines[-1].strip()
 
         # Only add punctuation if this appears to be a complete sentence
         # Check if last line needs punctuation and isn't a continuation
@@ -305,9 +278,10 @@ class ChineseProcessor:
             )  # Check if it's a continuation
         ):
             # Add period to last line
-            result_lines[-1] = last_line + "。"
+            return lines[:-1] + [last_line + "。"]
 
-        return result_lines
+        # Nothing to add: the lines are returned as they are
+        return lines
 
     def _is_line_continuation(self, line: str) -> bool:
         """Check if a line appears to be a continuation of a sentence.
@@ -326,26 +300,14 @@ class ChineseProcessor:
         # - Ends with comma
         # - Contains connecting words at the end
         # - Very short lines (likely incomplete thoughts)
-        continuation_indicators = {
-            "，",
-            "、",
-            "和",
-            "或",
-            "但",
-            "而",
-            "因为",
-            "所以",
-            "如果",
-            "那么",
-        }
 
         # Check if line ends with continuation indicators
         if line[-1] in "，、":
             return True
 
-        # Check if line ends with connecting words
-        words = line.split()
-        if words and words[-1] in continuation_indicators:
+        # Check if line ends with connecting words (the line is stripped and
+        # non-empty, so it has a last word)
+        if line.rsplit(None, 1)[-1] in self.continuation_indicators:
             return True
 
         # Very short lines are likely continuations
@@ -396,6 +358,8 @@ class ChineseProcessor:
         if len(lines) <= 1:
             return lines
 
+        self._char_limit = self.config.get_character_limit(self.config.language)
+
         result = []
         i = 0
 
@@ -410,12 +374,12 @@ class ChineseProcessor:
             if (
                 len(current_line) < 6
                 and i + 1 < len(lines)
-                and not current_line.endswith(tuple(self.sentence_endings))
+                and current_line[-1] not in self.sentence_endings
             ):
                 next_line = lines[i + 1].strip()
                 merged = current_line + next_line
 
-                char_limit = self.config.get_character_limit(self.config.language)
+                char_limit = self._char_limit
                 if len(merged) <= char_limit:
                     result.append(merged)
                     i += 2  # Skip next line as it's been merged
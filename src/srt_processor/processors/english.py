@@ -5,6 +5,14 @@ from typing import List
 
 from ..models.subtitle import ProcessingConfig, SubtitleBlock
 
+# A whole word: a run of non-space characters not preceded by one, so that a
+# search starting mid-word skips to the next word
+_WORD_RE = re.compile(r"(?<!\S)\S+")
+
+# Everything up to and including the last punctuation mark to break after
+# (matched within the search range, so the match ends at the break position)
+_LAST_BREAK_PUNCTUATION_RE = re.compile(r".*[.,!?;:]", re.DOTALL)
+
 
 class EnglishProcessor:
     """Processor for English subtitles with v2.0 word-based intelligent features."""
@@ -17,6 +25,10 @@ class EnglishProcessor:
         """
         self.config = config
 
+        # Character limit for the config language, refreshed by process_block
+        # since the config can be changed after construction
+        self._char_limit = config.get_character_limit(config.language)
+
         # Connective words and conjunctions for optimal breaking
         self.conjunctions = {
             "and",
@@ -69,14 +81,11 @@ class EnglishProcessor:
         }
 
         # Sentence ending punctuation
-        self.sentence_endings = ".!?"
+        self.sentence_endings = frozenset(".!?")
 
         # All punctuation marks
         self.punctuation = ".,!?;:\"\\'()[]{}—–-"
 
-        # Dialogue marker pattern
-        self.dialogue_pattern = re.compile(r"^-\s*(.*)$")
-
     def process_block(self, block: SubtitleBlock) -> SubtitleBlock:
         """Process an English subtitle block.
 
@@ -89,6 +98,23 @@ class EnglishProcessor:
         if not block.lines:
             return block
 
+        self._char_limit = self.config.get_character_limit(self.config.language)
+
+        # Fast path: a single, already clean line that fits (with no dash, or
+        # a "- " dialogue marker directly followed by text) comes out unchanged
+        if len(block.lines) == 1:
+            line = block.lines[0]
+            if (
+                line
+                and len(line) <= self._char_limit
+                and line == line.strip()
+                and (
+                    not line.startswith("-")
+                    or (line.startswith("- ") and not line[2].isspace())
+                )
+            ):
+                return block
+
         # Process dialogue formatting first
         processed_lines = self._process_dialogue_format(block.lines)
 
@@ -102,6 +128,10 @@ class EnglishProcessor:
         # Final check: merge overly short lines
         processed_lines = self._merge_short_lines(processed_lines)
 
+        # Keep the block when processing changed nothing
+        if processed_lines == block.lines:
+            return block
+
         # Create new block with processed lines
         new_block = SubtitleBlock(
             index=block.index,
@@ -130,9 +160,8 @@ class EnglishProcessor:
                 continue
 
             # Check if line starts with dash
-            match = self.dialogue_pattern.match(line)
-            if match:
-                content = match.group(1).strip()
+            if line.startswith("-"):
+                content = line[1:].strip()
                 processed_lines.append(f"- {content}")
             else:
                 processed_lines.append(line)
@@ -208,74 +237,41 @@ class EnglishProcessor:
         if not current:
             return False
 
+        # Never merge past the character limit (checked first: it rejects
+        # most candidates and is the cheapest test; +1 for the space)
+        if len(current) + 1 + len(next_line) > self._char_limit:
+            return False
+
         # Don't merge if current line ends with sentence punctuation
-        if current and current[-1] in self.sentence_endings:
+        if current[-1] in self.sentence_endings:
             return False
 
         # Don't merge two dialogue lines together
-        current_is_dialogue = current.startswith("- ")
-        next_is_dialogue = next_line.startswith("- ")
-        if current_is_dialogue and next_is_dialogue:
+        if current.startswith("- ") and next_line.startswith("- "):
             return False
 
-        # Be more aggressive about merging short lines
-        current_length = len(current.strip())
-        next_length = len(next_line.strip())
-
-        # Always merge if either line is very short (< 25 chars)
-        if current_length < 25 or next_length < 25:
-            merged_length = len(current) + 1 + len(next_line)  # +1 for space
-            char_limit = self.config.get_character_limit(self.config.language)
-            return merged_length <= char_limit
-
-        # Special case: merge if current ends with sentence and next is very short
-        if current.rstrip().endswith(".") and next_length < 20:
-            merged_length = len(current) + 1 + len(next_line)  # +1 for space
-            char_limit = self.config.get_character_limit(self.config.language)
-            return merged_length <= char_limit
-
-        # Merge if current line ends with connecting words
-        current_words = current.strip().split()
-        if current_words and current_words[-1].lower() in {
-            "a",
-            "an",
-            "the",
-            "of",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "with",
-            "by",
-            "and",
-            "or",
-            "but",
-        }:
-            merged_length = len(current) + 1 + len(next_line)  # +1 for space
-            char_limit = self.config.get_character_limit(self.config.language)
-            return merged_length <= char_limit
-
-        # Check character count after merging
-        merged_length = len(current) + 1 + len(next_line)  # +1 for space
-        char_limit = self.config.get_character_limit(self.config.language)
-
-        # Merge if it would fit within limits
-        return merged_length <= char_limit
+        # Otherwise merge whatever fits: short lines (< 25 chars), a very short
+        # line after a sentence and lines ending with connecting words are all
+        # merged when they fit, and so is everything else
+        return True
 
     def _apply_line_breaking(self, lines: List[str]) -> List[str]:
         """Apply intelligent line breaking to English text.
 
         Args:
-            lines: Input lines
+            lines: Input lines (none of them blank, as produced by
+                _process_dialogue_format and _smart_merge_lines)
 
         Returns:
             Lines with intelligent breaking applied
         """
+        char_limit = self._char_limit
         result_lines = []
 
         for line in lines:
-            if not line.strip():
+            # Lines that fit are kept as they are
+            if len(line) <= char_limit:
+                result_lines.append(line)
                 continue
 
             broken_lines = self._break_line_intelligently(line)
@@ -292,62 +288,55 @@ class EnglishProcessor:
         Returns:
             List of broken lines
         """
-        char_limit = self.config.get_character_limit(self.config.language)
-
-        # If line fits within limit, return as-is
-        if len(line) <= char_limit:
-            return [line]
-
-        # Apply v2.0 word threshold rule: don't break if remaining < 2 complete words
-        if not self._should_break_line(line, char_limit):
-            return [line]  # Don't break
-
-        # Find best break position
-        break_pos = self._find_best_break_position(line, char_limit)
-
-        if break_pos == -1:
-            # No good break position found, try word boundary breaking
-            break_pos = self._find_word_boundary_break(line, char_limit)
-
-        if break_pos == -1:
-            # Still no good position, force break at limit
-            break_pos = char_limit
-
-        # Split the line
-        first_part = line[:break_pos].rstrip()
-        second_part = line[break_pos:].lstrip()
-
-        # Recursively break the second part if needed (with safety check)
-        result = [first_part]
-        if second_part and len(second_part) < len(line):  # Prevent infinite recursion
-            result.extend(self._break_line_intelligently(second_part))
+        char_limit = self._char_limit
+        result = []
 
+        # Keep breaking off first parts while the rest exceeds the limit
+        while len(line) > char_limit:
+            # Apply v2.0 word threshold rule: don't break if remaining < 2 complete words.
+            # The rule only passes with a good break position, which it returns
+            break_pos = self._find_threshold_break_position(line, char_limit)
+            if break_pos == -1:
+                break  # Don't break
+
+            # Split the line
+            first_part = line[:break_pos].rstrip()
+            second_part = line[break_pos:].lstrip()
+
+            result.append(first_part)
+            if not second_part or len(second_part) >= len(line):
+                # Nothing (new) left to break: stop (prevents an endless loop)
+                return result
+            line = second_part
+
+        result.append(line)
         return result
 
-    def _should_break_line(self, line: str, char_limit: int) -> bool:
-        """Determine if line should be broken based on v2.0 word threshold rule.
+    def _find_threshold_break_position(self, line: str, char_limit: int) -> int:
+        """Find where to break a line that passes the v2.0 word threshold rule.
 
         Args:
             line: Line to check
             char_limit: Character limit
 
         Returns:
-            True if line should be broken
+            Best break position, or -1 if the line should not be broken
         """
         if len(line) <= char_limit:
-            return False
+            return -1
 
         # Find where the char limit falls in the text
         remaining_text = line[char_limit:].strip()
         if not remaining_text:
-            return False
+            return -1
 
-        # Count complete words in remaining text
-        remaining_words = remaining_text.split()
+        # Count complete words in remaining text (splitting at most 3 times:
+        # only whether there are 4 matters)
+        remaining_words = remaining_text.split(None, 3)
 
         # Don't break if less than 4 complete words remaining (more conservative)
         if len(remaining_words) < 4:
-            return False
+            return -1
 
         # Also check if breaking would create a very short second line
         # Find the best break position
@@ -357,17 +346,17 @@ class EnglishProcessor:
             # Don't break if second part would be too short (< 20 chars)
             # This prevents issues like "Do that, then." being on its own line
             if len(second_part) < 20:
-                return False
+                return -1
 
-            # Also check word count in second part
-            second_part_words = second_part.split()
+            # Also check word count in second part (whether there are 3)
+            second_part_words = second_part.split(None, 2)
             if len(second_part_words) < 3:
-                return False
+                return -1
         else:
             # If no good break position found, be more conservative
-            return False
+            return -1
 
-        return True
+        return break_pos
 
     def _find_best_break_position(self, line: str, limit: int) -> int:
         """Find the best position to break an English line.
@@ -383,53 +372,28 @@ class EnglishProcessor:
         search_start = max(0, limit - 20)  # Look within 20 chars of limit
         search_end = min(len(line), limit)
 
-        # 1. Look for punctuation marks (highest priority)
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] in ".,!?;:":
-                # Break after punctuation
-                return i + 1
-
-        # 2. Look for conjunctions (break before them)
-        words_before_limit = line[:limit].split()
-        for i, word in enumerate(words_before_limit):
-            clean_word = word.lower().strip(self.punctuation)
+        # 1. Look for punctuation marks (highest priority): the last one in range
+        match = _LAST_BREAK_PUNCTUATION_RE.match(line, search_start, search_end)
+        if match:
+            # Break after punctuation
+            return match.end()
+
+        # One pass over the words starting within the search range (lowercased
+        # and stripped of punctuation), breaking before them:
+        # 2. the first conjunction, else 3. the first preposition
+        punctuation = self.punctuation
+        preposition_pos = -1
+        for match in _WORD_RE.finditer(line, search_start):
+            word_pos = match.start()
+            if word_pos > search_end:
+                break
+            clean_word = match.group().lower().strip(punctuation)
             if clean_word in self.conjunctions:
-                # Find position of this word in the original line
-                word_pos = line.lower().find(clean_word)
-                if search_start <= word_pos <= search_end:
-                    return word_pos
-
-        # 3. Look for prepositions (break before them)
-        for i, word in enumerate(words_before_limit):
-            clean_word = word.lower().strip(self.punctuation)
-            if clean_word in self.prepositions:
-                # Find position of this word in the original line
-                word_pos = line.lower().find(clean_word)
-                if search_start <= word_pos <= search_end:
-                    return word_pos
-
-        return -1
-
-    def _find_word_boundary_break(self, line: str, limit: int) -> int:
-        """Find word boundary break position near the limit.
+                return word_pos
+            if preposition_pos == -1 and clean_word in self.prepositions:
+                preposition_pos = word_pos
 
-        Args:
-            line: Line to analyze
-            limit: Character limit
-
-        Returns:
-            Word boundary break position, or -1 if not found
-        """
-        # Look for spaces near the limit
-        search_start = max(0, limit - 15)
-        search_end = min(len(line), limit + 5)
-
-        # Find the last space before or near the limit
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] == " ":
-                return i
-
-        return -1
+        return preposition_pos
 
     def validate_reading_speed(self, block: SubtitleBlock) -> bool:
         """Validate reading speed for English subtitles.
@@ -526,11 +490,16 @@ class EnglishProcessor:
         if len(lines) <= 1:
             return lines
 
+        # Strip each line and check its dialogue marker once up front
+        stripped = [line.strip() for line in lines]
+        is_dialogue = [line.startswith("- ") for line in stripped]
+        line_count = len(lines)
+
         result = []
         i = 0
 
-        while i < len(lines):
-            current_line = lines[i].strip()
+        while i < line_count:
+            current_line = stripped[i]
 
             if not current_line:
                 result.append(lines[i])
@@ -538,12 +507,12 @@ class EnglishProcessor:
                 continue
 
             # Check if we can merge with next line
-            if i + 1 < len(lines) and lines[i + 1].strip():
-                next_line = lines[i + 1].strip()
+            if i + 1 < line_count and stripped[i + 1]:
+                next_line = stripped[i + 1]
 
                 # Check if dialogue markers match
-                current_is_dialogue = current_line.startswith("- ")
-                next_is_dialogue = next_line.startswith("- ")
+                current_is_dialogue = is_dialogue[i]
+                next_is_dialogue = is_dialogue[i + 1]
 
                 # More aggressive merging conditions:
                 should_merge = False
@@ -574,7 +543,7 @@ class EnglishProcessor:
                         # Regular merge
                         merged = f"{current_line} {next_line}"
 
-                    char_limit = self.config.get_character_limit(self.config.language)
+                    char_limit = self._char_limit
                     if merged and len(merged) <= char_limit:
                         result.append(merged)
                         i += 2  # Skip next line as it's been merged
@@ -5,6 +5,95 @@ from typing import List
 
 from ..models.subtitle import ProcessingConfig, SubtitleBlock
 
+# Korean punctuation marks
+_PUNCTUATION = frozenset("。！？，：；'（）【】《》")
+
+# Korean helper particles and endings for intelligent line breaking
+_HELPER_PARTICLES = frozenset(
+    {
+        "은",
+        "는",
+        "이",
+        "가",
+        "을",
+        "를",
+        "에",
+        "에서",
+        "로",
+        "으로",
+        "와",
+        "과",
+        "의",
+        "도",
+        "만",
+        "까지",
+        "부터",
+        "보다",
+        "처럼",
+        "다",
+        "요",
+        "죠",
+        "네",
+        "지",
+        "니",
+        "까",
+        "야",
+        "아",
+        "어",
+        "고",
+        "서",
+        "면",
+        "려고",
+        "하고",
+        "때문에",
+        "가지고",
+    }
+)
+
+# Sentence ending punctuation
+_SENTENCE_ENDINGS = frozenset("。！？")
+
+# Endings that suggest a sentence continues (a tuple for str.endswith)
+_CONTINUATION_ENDINGS = (
+    "고",
+    "서",
+    "면",
+    "며",
+    "는데",
+    "지만",
+    "하고",
+    "가지고",
+    "때문에",
+    "하면서",
+    "다가",
+    "으면서",
+    "으니까",
+    "니까",
+    "하여",
+    "해서",
+    "에서",
+    "으로",
+    "로",
+    "와",
+    "과",
+)
+
+# Break candidates, matched as everything up to the last candidate in a search
+# range (so the match ends right after it)
+_LAST_TWO_CHAR_PARTICLE_RE = re.compile(
+    ".*(?:%s)"
+    % "|".join(map(re.escape, sorted(p for p in _HELPER_PARTICLES if len(p) == 2))),
+    re.DOTALL,
+)
+_LAST_PARTICLE_RE = re.compile(
+    ".*[%s]"
+    % "".join(map(re.escape, sorted(p for p in _HELPER_PARTICLES if len(p) == 1))),
+    re.DOTALL,
+)
+_LAST_PUNCTUATION_RE = re.compile(
+    ".*[%s]" % "".join(map(re.escape, sorted(_PUNCTUATION))), re.DOTALL
+)
+
 
 class KoreanProcessor:
     """Processor for Korean subtitles with v2.2 intelligent features."""
@@ -17,54 +106,21 @@ class KoreanProcessor:
         """
         self.config = config
 
+        # Character limit for the config language, refreshed by process_block
+        # since the config can be changed after construction
+        self._char_limit = config.get_character_limit(config.language)
+
         # Korean punctuation marks
-        self.punctuation = "。！？，：；" "''（）【】《》"
+        self.punctuation = _PUNCTUATION
 
         # Korean helper particles and endings for intelligent line breaking
-        self.helper_particles = {
-            "은",
-            "는",
-            "이",
-            "가",
-            "을",
-            "를",
-            "에",
-            "에서",
-            "로",
-            "으로",
-            "와",
-            "과",
-            "의",
-            "도",
-            "만",
-            "까지",
-            "부터",
-            "보다",
-            "처럼",
-            "다",
-            "요",
-            "죠",
-            "네",
-            "지",
-            "니",
-            "까",
-            "야",
-            "아",
-            "어",
-            "고",
-            "서",
-            "면",
-            "려고",
-            "하고",
-            "때문에",
-            "가지고",
-        }
+        self.helper_particles = _HELPER_PARTICLES
 
         # Sentence ending punctuation
-        self.sentence_endings = "。！？"
+        self.sentence_endings = _SENTENCE_ENDINGS
 
-        # Dialogue marker pattern
-        self.dialogue_pattern = re.compile(r"^-\s*(.*)$")
+        # Endings that suggest a sentence continues (a tuple for str.endswith)
+        self.continuation_endings = _CONTINUATION_ENDINGS
 
     def process_block(self, block: SubtitleBlock) -> SubtitleBlock:
         """Process a Korean subtitle block.
@@ -78,20 +134,29 @@ class KoreanProcessor:
         if not block.lines:
             return block
 
+        self._char_limit = self.config.get_character_limit(self.config.language)
+
         # Process dialogue formatting first
         processed_lines = self._process_dialogue_format(block.lines)
 
-        # Smart merge if multiple lines
-        if len(processed_lines) > 1:
-            processed_lines = self._smart_merge_lines(processed_lines)
+        # Most blocks are a single line that fits, which needs neither
+        # merging nor breaking
+        if len(processed_lines) != 1 or len(processed_lines[0]) > self._char_limit:
+            # Smart merge if multiple lines
+            if len(processed_lines) > 1:
+                processed_lines = self._smart_merge_lines(processed_lines)
 
-        # Apply intelligent line breaking
-        processed_lines = self._apply_line_breaking(processed_lines)
+            # Apply intelligent line breaking
+            processed_lines = self._apply_line_breaking(processed_lines)
 
         # Add missing punctuation if enabled
         if not self.config.no_punct_fix:
             processed_lines = self._add_missing_punctuation(processed_lines)
 
+        # Keep the block when processing changed nothing
+        if processed_lines == block.lines:
+            return block
+
         # Create new block with processed lines
         new_block = SubtitleBlock(
             index=block.index,
@@ -120,9 +185,8 @@ class KoreanProcessor:
                 continue
 
             # Check if line starts with dash
-            match = self.dialogue_pattern.match(line)
-            if match:
-                content = match.group(1).strip()
+            if line.startswith("-"):
+                content = line[1:].strip()
                 processed_lines.append(f"- {content}")
             else:
                 processed_lines.append(line)
@@ -193,7 +257,7 @@ class KoreanProcessor:
 
         # Check character count after merging (include space)
         merged_length = len(current) + 1 + len(next_line)
-        char_limit = self.config.get_character_limit(self.config.language)
+        char_limit = self._char_limit
 
         # Merge if it would fit within limits
         return merged_length <= char_limit
@@ -202,15 +266,19 @@ class KoreanProcessor:
         """Apply intelligent line breaking to Korean text.
 
         Args:
-            lines: Input lines
+            lines: Input lines (none of them blank, as produced by
+                _process_dialogue_format and _smart_merge_lines)
 
         Returns:
             Lines with intelligent breaking applied
         """
+        char_limit = self._char_limit
         result_lines = []
 
         for line in lines:
-            if not line.strip():
+            # Lines that fit are kept as they are
+            if len(line) <= char_limit:
+                result_lines.append(line)
                 continue
 
             broken_lines = self._break_line_intelligently(line)
@@ -227,38 +295,37 @@ class KoreanProcessor:
         Returns:
             List of broken lines
         """
-        char_limit = self.config.get_character_limit(self.config.language)
-
-        # If line fits within limit, return as-is
-        if len(line) <= char_limit:
-            return [line]
+        char_limit = self._char_limit
+        result = []
 
-        # Apply threshold rule: don't break if remaining < 3 chars (similar to Chinese)
-        remaining_chars = len(line) - char_limit
-        if remaining_chars < 3:
-            return [line]  # Don't break
+        # Keep breaking off first parts while the rest exceeds the limit; every
+        # break shortens the rest (position 0 is only used for a leading space)
+        while len(line) > char_limit:
+            # Apply threshold rule: don't break if remaining < 3 chars (similar to Chinese)
+            remaining_chars = len(line) - char_limit
+            if remaining_chars < 3:
+                break  # Don't break
 
-        # Find best break position
-        break_pos = self._find_best_break_position(line, char_limit)
+            # Find best break position
+            break_pos = self._find_best_break_position(line, char_limit)
 
-        if break_pos == -1:
-            # No good break position found, force break at limit
-            break_pos = char_limit
+            if break_pos == -1:
+                # No good break position found, force break at limit
+                break_pos = char_limit
 
-        # Split the line
-        first_part = line[:break_pos].rstrip()
-        second_part = line[break_pos:].lstrip()
+            # Split the line
+            first_part = line[:break_pos].rstrip()
+            second_part = line[break_pos:].lstrip()
 
-        # Ensure second part meets minimum length requirement (≥4 chars for Korean)
-        if len(second_part) < 4:
-            # If second part too short, don't break
-            return [line]
+            # Ensure second part meets minimum length requirement (≥4 chars for Korean)
+            if len(second_part) < 4:
+                # If second part too short, don't break
+                break
 
-        # Recursively break the second part if needed (with safety check)
-        result = [first_part]
-        if second_part and len(second_part) < len(line):  # Prevent infinite recursion
-            result.extend(self._break_line_intelligently(second_part))
+            result.append(first_part)
+            line = second_part
 
+        result.append(line)
         return result
 
     def _find_best_break_position(self, line: str, limit: int) -> int:
@@ -275,34 +342,32 @@ class KoreanProcessor:
         search_start = max(0, limit - 8)  # Look within 8 chars of limit
         search_end = min(len(line), limit + 3)  # Don't go too far past limit
 
-        # 1. Look for spaces (word boundaries are important in Korean)
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] == " ":
-                if i <= limit:
-                    return i
+        # 1. Look for spaces (word boundaries are important in Korean): the
+        # last one at or before the limit
+        space_pos = line.rfind(" ", search_start, min(search_end, limit + 1))
+        if space_pos != -1:
+            return space_pos
+
+        # Particles and punctuation are broken after, so must end by the limit
+        candidate_end = min(search_end, limit)
 
         # 2. Look for Korean particles and endings near the limit
-        for i in range(search_end - 2, search_start - 1, -1):
-            if i >= 0 and i + 2 <= len(line):
-                two_char = line[i : i + 2]
-                if two_char in self.helper_particles:
-                    # Break after the particle
-                    if i + 2 <= limit:
-                        return i + 2
+        match = _LAST_TWO_CHAR_PARTICLE_RE.match(line, search_start, candidate_end)
+        if match:
+            # Break after the particle
+            return match.end()
 
         # 3. Look for single character particles
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] in self.helper_particles:
-                # Break after the particle
-                if i + 1 <= limit:
-                    return i + 1
+        match = _LAST_PARTICLE_RE.match(line, search_start, candidate_end)
+        if match:
+            # Break after the particle
+            return match.end()
 
         # 4. Look for punctuation marks
-        for i in range(search_end - 1, search_start - 1, -1):
-            if i < len(line) and line[i] in self.punctuation:
-                # Break after punctuation
-                if i + 1 <= limit:
-                    return i + 1
+        match = _LAST_PUNCTUATION_RE.match(line, search_start, candidate_end)
+        if match:
+            # Break after punctuation
+            return match.end()
 
         # 5. No good position found
         return -1
@@ -319,8 +384,7 @@ class KoreanProcessor:
         if not lines:
             return lines
 
-        result_lines = lines.copy()
-        last_line = result_lines[-1].strip()
+        last_line = lines[-1].strip()
 
         # Only add punctuation if this appears to be a complete sentence
         # Check if last line needs punctuation and isn't a continuation
@@ -329,17 +393,15 @@ class KoreanProcessor:
             and last_line[-1] not in self.punctuation
             and not last_line.endswith("...")
             and not last_line.startswith("♪")  # Don't add to SDH markers
-            and not last_line.endswith(
-                ("고", "서", "면", "며", "는데", "지만", "하고")
-            )  # Don't add if ends with Korean connectors (continuation)
-            and not self._is_line_continuation(
-                last_line
-            )  # Check if it's a continuation
+            # Don't add if it's a continuation (this includes ending with
+            # Korean connectors, see continuation_endings)
+            and not self._is_line_continuation(last_line)
         ):
             # Add period to last line (Korean often uses 。)
-            result_lines[-1] = last_line + "."
+            return lines[:-1] + [last_line + "."]
 
-        return result_lines
+        # Nothing to add: the lines are returned as they are
+        return lines
 
     def _is_line_continuation(self, line: str) -> bool:
         """Check if a line appears to be a continuation of a sentence.
@@ -354,35 +416,9 @@ class KoreanProcessor:
         if not line:
             return False
 
-        # Common Korean patterns that suggest continuation:
-        continuation_endings = {
-            "고",
-            "서",
-            "면",
-            "며",
-            "는데",
-            "지만",
-            "하고",
-            "가지고",
-            "때문에",
-            "하면서",
-            "다가",
-            "으면서",
-            "으니까",
-            "니까",
-            "하여",
-            "해서",
-            "에서",
-            "으로",
-            "로",
-            "와",
-            "과",
-        }
-
-        # Check if line ends with continuation patterns
-        for ending in continuation_endings:
-            if line.endswith(ending):
-                return True
+        # Check if line ends with common Korean continuation patterns
+        if line.endswith(self.continuation_endings):
+            return True
 
         # Very short lines are likely continuations
         if len(line) < 6:
@@ -431,6 +467,8 @@ class KoreanProcessor:
         if len(lines) <= 1:
             return lines
 
+        self._char_limit = self.config.get_character_limit(self.config.language)
+
         result = []
         i = 0
 
@@ -445,12 +483,12 @@ class KoreanProcessor:
             if (
                 len(current_line) < 5
                 and i + 1 < len(lines)
-                and not current_line.endswith(tuple(self.sentence_endings))
+                and current_line[-1] not in self.sentence_endings
             ):
                 next_line = lines[i + 1].strip()
                 merged = current_line + " " + next_line
 
-                char_limit = self.config.get_character_limit(self.config.language)
+                char_limit = self._char_limit
                 if len(merged) <= char_limit:
                     result.append(merged)
                     i += 2  # Skip next line as it's been merged
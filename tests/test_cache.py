@@ -0,0 +1,69 @@
+"""Tests for the on-disk check result cache."""
+
+from src.srt_processor.core import cache as cache_module
+from src.srt_processor.core.cache import ResultCache
+from src.srt_processor.core.processor import SRTProcessor
+from src.srt_processor.models.subtitle import ProcessingConfig
+
+# A block that breaks the English reading speed limit
+_FAST_SRT = (
+    "1\n00:00:01,000 --> 00:00:01,500\n"
+    "This line is far too long to read in half a second\n\n"
+)
+
+
+def _check(tmp_path):
+    """Write a sample file and return its path, config and fresh results."""
+    path = tmp_path / "fast.srt"
+    path.write_text(_FAST_SRT, encoding="utf-8")
+    config = ProcessingConfig()
+    return str(path), config, SRTProcessor(config).check_file_only(str(path))
+
+
+def test_round_trip(tmp_path):
+    input_path, config, results = _check(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.make_key(input_path, config)
+
+    cache.put(key, results)
+    cached = cache.get(key)
+
+    assert cached["warnings"] == results["warnings"]
+    assert cached["violations"] == results["violations"]
+    block = cached["violation_blocks"][0]["block"]
+    assert block == results["violation_blocks"][0]["block"]
+    assert "original_document" not in cached
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    input_path, config, _ = _check(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.make_key(input_path, config)
+
+    cache.cache_dir.mkdir()
+    (cache.cache_dir / f"{key}.json").write_bytes(b"\x80\x04\x95not json")
+
+    assert cache.get(key) is None
+
+
+def test_malformed_entry_is_a_miss(tmp_path):
+    input_path, config, _ = _check(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.make_key(input_path, config)
+
+    cache.cache_dir.mkdir()
+    (cache.cache_dir / f"{key}.json").write_text(
+        '{"violation_blocks": [{"block": {"index": 1}}]}', encoding="utf-8"
+    )
+
+    assert cache.get(key) is None
+
+
+def test_version_changes_key(tmp_path, monkeypatch):
+    input_path, config, _ = _check(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.make_key(input_path, config)
+
+    monkeypatch.setattr(cache_module, "__version__", "0.0.0")
+
+    assert cache.make_key(input_path, config) != key
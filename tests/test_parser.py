@@ -0,0 +1,36 @@
+"""Tests for SRT file encoding detection."""
+
+from src.srt_processor.core.parser import _ENCODING_SAMPLE_SIZE, SRTParser
+
+# One ASCII-only subtitle block
+_ASCII_BLOCK = "{}\n00:00:01,000 --> 00:00:02,000\nHello there\n\n"
+
+
+def _write_ascii_prefixed(path, tail: str, encoding: str) -> None:
+    """Write ASCII blocks past the encoding sample, then one encoded block."""
+    blocks = []
+    size = 0
+    while size <= _ENCODING_SAMPLE_SIZE:
+        blocks.append(_ASCII_BLOCK.format(len(blocks) + 1))
+        size += len(blocks[-1])
+    blocks.append(f"{len(blocks) + 1}\n00:00:03,000 --> 00:00:04,000\n{tail}\n")
+    path.write_bytes("".join(blocks).encode(encoding))
+
+
+def test_non_utf8_bytes_after_ascii_sample(tmp_path):
+    path = tmp_path / "late_accent.srt"
+    _write_ascii_prefixed(path, "Café résumé à côté", "cp1252")
+
+    document = SRTParser().parse_file(str(path))
+
+    assert document.blocks[-1].lines == ["Café résumé à côté"]
+    assert document.encoding.lower() != "utf-8"
+
+
+def test_utf8_after_ascii_sample(tmp_path):
+    path = tmp_path / "late_utf8.srt"
+    _write_ascii_prefixed(path, "Café résumé à côté", "utf-8")
+
+    document = SRTParser().parse_file(str(path))
+
+    assert document.blocks[-1].lines == ["Café résumé à côté"]